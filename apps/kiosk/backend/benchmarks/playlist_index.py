@@ -0,0 +1,112 @@
+"""Compares the old linear playlist scans with PlaylistIndex.
+
+The "snapshot" rows include the copy() every writer makes before changing the
+index, which is what a delete or move costs in the app.
+
+Run from apps/kiosk/backend:
+
+    python benchmarks/playlist_index.py
+"""
+
+from pathlib import Path
+import random
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main import PictureEntry, PlaylistIndex  # noqa: E402
+
+
+def make_entries(n: int) -> list[PictureEntry]:
+    return [
+        PictureEntry(
+            picture_id=f"{i:032x}",
+            filename=f"{i:032x}.jpg",
+            original_filename=f"{i}.jpg",
+            content_type="image/jpeg",
+            uploaded_at=i,
+            sha256=f"{i:064x}",
+            sort_key=float(i),
+        )
+        for i in range(n)
+    ]
+
+
+def linear_get(images: list[PictureEntry], picture_id: str) -> PictureEntry | None:
+    for image in images:
+        if image.picture_id == picture_id:
+            return image
+    return None
+
+
+def linear_advance(images: list[PictureEntry], current_id: str) -> str:
+    current_idx = 0
+    for idx, image in enumerate(images):
+        if image.picture_id == current_id:
+            current_idx = idx
+            break
+    return images[(current_idx + 1) % len(images)].picture_id
+
+
+def linear_delete(images: list[PictureEntry], picture_id: str):
+    idx = next((i for i, image in enumerate(images) if image.picture_id == picture_id), None)
+    image = images.pop(idx)
+    {entry.picture_id for entry in images}
+    images.append(image)
+
+
+def index_delete(index: PlaylistIndex, picture_id: str):
+    image, _ = index.remove(picture_id)
+    index.append(image)
+
+
+def snapshot_delete(index: PlaylistIndex, picture_id: str) -> PlaylistIndex:
+    index = index.copy()
+    image, _ = index.remove(picture_id)
+    index.append(image)
+    return index
+
+
+def snapshot_move(index: PlaylistIndex, picture_id: str, before_picture_id: str) -> PlaylistIndex:
+    index = index.copy()
+    index.move(picture_id, before_picture_id)
+    return index
+
+
+def bench(label: str, stmt, number: int):
+    seconds = timeit.timeit(stmt, number=number)
+    print(f"  {label:<22} {seconds / number * 1e6:10.2f} us/op")
+
+
+def main():
+    for n in (10_000, 100_000):
+        entries = make_entries(n)
+        images = list(entries)
+        index = PlaylistIndex(make_entries(n))
+        ids = [entry.picture_id for entry in entries]
+        rng = random.Random(0)
+        number = 200 if n <= 10_000 else 20
+
+        print(f"{n} pictures")
+        bench("linear get", lambda: linear_get(images, rng.choice(ids)), number)
+        bench("index get", lambda: index.get(rng.choice(ids)), number * 100)
+        bench("linear advance", lambda: linear_advance(images, rng.choice(ids)), number)
+        bench(
+            "index advance",
+            lambda: index.at(((index.position(rng.choice(ids)) or 0) + 1) % len(index)),
+            number * 100,
+        )
+        bench("linear delete", lambda: linear_delete(images, rng.choice(ids)), number)
+        bench("index delete", lambda: index_delete(index, rng.choice(ids)), number * 10)
+        bench("index move", lambda: index.move(rng.choice(ids), rng.choice(ids)), number * 10)
+        bench("snapshot delete", lambda: snapshot_delete(index, rng.choice(ids)), number)
+        bench(
+            "snapshot move",
+            lambda: snapshot_move(index, rng.choice(ids), rng.choice(ids)),
+            number,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Compares bytes sent for the first paint of the kiosk SPA and the remote UI.
+
+For each Accept-Encoding a browser might send, the assets needed before the
+first paint are fetched through the real apps and the bytes on the wire are
+summed, next to how long serving took and how long the transfer would take
+on a few link speeds.
+
+Run from apps/kiosk/backend:
+
+    python benchmarks/static_assets.py
+"""
+
+from pathlib import Path
+import importlib.util
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+REMOTE_DIR = BACKEND_DIR.parent.parent / "remote"
+
+ACCEPT_ENCODINGS = ["identity", "gzip", "gzip, deflate, br"]
+LINK_MBITS = [2, 10, 50]
+ROUNDS = 20
+
+# Everything the remote page must fetch before it can render anything.
+REMOTE_FIRST_PAINT = ["/static/remote.css", "/static/remote.js"]
+
+
+def load_app(name: str, path: Path):
+    sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module._precompress_static_assets()
+    return module.app
+
+
+def kiosk_first_paint() -> list[str]:
+    # Asset names carry the build hash, so read them from index.html.
+    html = (BACKEND_DIR / "static" / "index.html").read_text()
+    paths = ["/"]
+    for attr in ('src="', 'href="'):
+        for chunk in html.split(attr)[1:]:
+            ref = chunk.split('"', 1)[0]
+            if ref.startswith("/assets/"):
+                paths.append(ref)
+    return paths
+
+
+def measure(client: TestClient, paths: list[str], accept_encoding: str) -> tuple[int, float]:
+    sent = 0
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        sent = 0
+        for path in paths:
+            response = client.get(path, headers={"Accept-Encoding": accept_encoding})
+            response.raise_for_status()
+            sent += int(response.headers["content-length"])
+    return sent, (time.perf_counter() - started) / ROUNDS
+
+
+def main() -> None:
+    apps = {
+        "kiosk": (load_app("kiosk_main", BACKEND_DIR / "main.py"), kiosk_first_paint()),
+        "remote": (load_app("remote_main", REMOTE_DIR / "main.py"), REMOTE_FIRST_PAINT),
+    }
+    header = f"{'app':8} {'accept-encoding':20} {'bytes':>9} {'serve ms':>9}"
+    header += "".join(f" {f'@{mbit}Mbit ms':>11}" for mbit in LINK_MBITS)
+    print(header)
+    for name, (app, paths) in apps.items():
+        client = TestClient(app)
+        for accept_encoding in ACCEPT_ENCODINGS:
+            sent, seconds = measure(client, paths, accept_encoding)
+            row = f"{name:8} {accept_encoding:20} {sent:9d} {seconds * 1000:9.2f}"
+            row += "".join(f" {sent * 8 / (mbit * 1000):11.1f}" for mbit in LINK_MBITS)
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
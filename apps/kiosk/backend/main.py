@@ -1,20 +1,42 @@
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from email.utils import formatdate, parsedate_to_datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional
 import asyncio
+import base64
+import bisect
+import gzip
+import hashlib
+import io
 import json
+import logging
+import mimetypes
+import multiprocessing
+import os
+import queue
 import re
-import shutil
+import sqlite3
 import subprocess
 import threading
 import time
 import uuid
 
-from fastapi import APIRouter, FastAPI, File, HTTPException, UploadFile
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import APIRouter, FastAPI, File, HTTPException, Request, Response, UploadFile
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from PIL import ExifTags, Image, ImageOps
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+try:
+    import brotli
+except ImportError:  # Optional: without it only .gz siblings are built.
+    brotli = None
+
+
+log = logging.getLogger("kiosk")
 
 app = FastAPI(title="Kiosk Backend")
 api = APIRouter(prefix="/api")
@@ -24,43 +46,196 @@ api = APIRouter(prefix="/api")
 # SSE
 #
 
-_subs: list[asyncio.Queue[str]] = []
+SSE_REPLAY_EVENTS = 256
+SSE_PING_SECONDS = 20.0
+SSE_MAX_SUBSCRIBERS = int(os.getenv("KIOSK_SSE_MAX_SUBSCRIBERS", "16"))
+SSE_STALL_SECONDS = 60.0
+SSE_MAX_PENDING = 100
+# Snapshots where only the newest matters; everything else is delivered in order.
+SSE_COALESCED_EVENTS = {"volume", "picture", "call", "prefetch"}
+
+
+class _Subscriber:
+    def __init__(self):
+        self.pending: OrderedDict[str | int, tuple[int, str]] = OrderedDict()
+        self.wakeup = asyncio.Event()
+        self.stalled_since: float | None = None
+        self.evicted = False
+
+    def push(self, event: str, event_id: int, frame: str):
+        key: str | int = event if event in SSE_COALESCED_EVENTS else event_id
+        if self.pending.pop(key, None) is not None:
+            _sse_stats["coalesced"] += 1
+        # Re-inserted at the end so that pending frames stay in id order.
+        self.pending[key] = (event_id, frame)
+        if self.stalled_since is None:
+            self.stalled_since = time.monotonic()
+        self.wakeup.set()
+
+    def pop(self) -> tuple[int, str] | None:
+        if not self.pending:
+            return None
+        _, item = self.pending.popitem(last=False)
+        self.stalled_since = time.monotonic() if self.pending else None
+        return item
+
+    def is_stuck(self) -> bool:
+        if len(self.pending) > SSE_MAX_PENDING:
+            return True
+        if self.stalled_since is None:
+            return False
+        return time.monotonic() - self.stalled_since > SSE_STALL_SECONDS
+
+
+_app_loop: asyncio.AbstractEventLoop | None = None
+_subs: list[_Subscriber] = []
+_sse_stats = {"coalesced": 0, "evicted": 0, "rejected": 0}
+_sse_lock = threading.Lock()
+# Ids start at the boot time in ms so they keep increasing across restarts.
+_sse_next_id = time.time_ns() // 1_000_000
+_sse_history: deque[tuple[int, str]] = deque(maxlen=SSE_REPLAY_EVENTS)
 
 
 def sse_send(event: str, data: Any = None):
-    msg = json.dumps({"event": event, "data": data})
-    for q in list(_subs):
-        try:
-            q.put_nowait(msg)
-        except asyncio.QueueFull:
-            pass
+    """Publishes an event to every subscriber; safe to call from any thread."""
+    _sse_publish(event, json.dumps({"event": event, "data": data}))
+
+
+def sse_send_json(event: str, data: bytes):
+    """Like sse_send, for a payload that is already serialized (see _cached_json)."""
+    _sse_publish(event, f'{{"event": {json.dumps(event)}, "data": {data.decode()}}}')
+
+
+def _sse_publish(event: str, msg: str):
+    global _sse_next_id
+    with _sse_lock:
+        event_id = _sse_next_id
+        _sse_next_id += 1
+        frame = f"id: {event_id}\ndata: {msg}\n\n"
+        _sse_history.append((event_id, frame))
+        loop = _app_loop
+        # Scheduled under the lock so that the loop sees events in id order.
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(_sse_fanout, event, event_id, frame)
+
+
+def _sse_fanout(event: str, event_id: int, frame: str):
+    for sub in list(_subs):
+        sub.push(event, event_id, frame)
+        if sub.is_stuck():
+            # The client stopped reading; it will resync when it reconnects.
+            sub.evicted = True
+            sub.wakeup.set()
+            _subs.remove(sub)
+            _sse_stats["evicted"] += 1
+
+
+def _sse_replay(last_event_id: str | None) -> list[tuple[int, str]] | None:
+    """Events after `last_event_id`, or None if the client has to resync."""
+    try:
+        last_id = int(last_event_id or "")
+    except ValueError:
+        return None
+    with _sse_lock:
+        history = list(_sse_history)
+        newest = _sse_next_id - 1
+    oldest = history[0][0] if history else _sse_next_id
+    if last_id < oldest - 1 or last_id > newest:
+        return None
+    return [item for item in history if item[0] > last_id]
+
+
+# Serialized bodies of the hot read endpoints, each tagged with the version of
+# the state it was rendered from. SSE pushes reuse the same bytes.
+_response_cache: dict[str, tuple[Any, bytes]] = {}
+
+
+def _cached_json(name: str, version: Any, build: Callable[[], Any]) -> bytes:
+    """`build()` as JSON, rendered at most once per `version`; safe without locks."""
+    cached = _response_cache.get(name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    body = json.dumps(build(), ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+    _response_cache[name] = (version, body)
+    return body
+
+
+def _json_response(body: bytes, headers: dict[str, str] | None = None) -> Response:
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @api.get("/events")
-async def events():
-    q: asyncio.Queue[str] = asyncio.Queue(maxsize=100)
-    _subs.append(q)
+async def events(request: Request):
+    # EventSource sends the header on its own reconnects; the kiosk hook
+    # reconnects manually and passes the query parameter instead.
+    last_event_id = request.headers.get("last-event-id")
+    last_event_id = last_event_id or request.query_params.get("last_event_id")
+    if len(_subs) >= SSE_MAX_SUBSCRIBERS:
+        _sse_stats["rejected"] += 1
+        raise HTTPException(503, "Too many event subscribers", headers={"Retry-After": "5"})
+    sub = _Subscriber()
 
     async def gen():
+        # Registered here rather than in the handler, so that a client gone
+        # before the first chunk never leaves a subscriber behind; the replay
+        # is taken in the same step so no event falls between the two.
+        _subs.append(sub)
+        replay = _sse_replay(last_event_id) if last_event_id else []
+        delivered = 0
         try:
-            while True:
-                try:
-                    msg = await asyncio.wait_for(q.get(), timeout=20.0)
-                    yield f"data: {msg}\n\n"
-                except asyncio.TimeoutError:
-                    yield ": ping\n\n"
+            if replay is None:
+                yield f"data: {json.dumps({'event': 'resync', 'data': None})}\n\n"
+            else:
+                for event_id, frame in replay:
+                    delivered = event_id
+                    yield frame
+            while not sub.evicted:
+                item = sub.pop()
+                if item is None:
+                    sub.wakeup.clear()
+                    try:
+                        await asyncio.wait_for(sub.wakeup.wait(), timeout=SSE_PING_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield ": ping\n\n"
+                    continue
+                event_id, frame = item
+                # Anything already sent as part of the replay.
+                if event_id <= delivered:
+                    continue
+                delivered = event_id
+                yield frame
         finally:
-            _subs.remove(q)
+            if sub in _subs:
+                _subs.remove(sub)
 
     return StreamingResponse(gen(), media_type="text/event-stream")
 
 
+@api.get("/events/stats")
+async def events_stats():
+    subs = list(_subs)
+    return {
+        "subscribers": len(subs),
+        "max_subscribers": SSE_MAX_SUBSCRIBERS,
+        "queue_depths": [len(sub.pending) for sub in subs],
+        **_sse_stats,
+    }
+
+
 #
 # Volume
 #
 
-SOUND_SINK = "alsa_output.platform-soc_107c000000_sound.stereo-fallback"
+SOUND_SINK = os.getenv(
+    "KIOSK_SOUND_SINK", "alsa_output.platform-soc_107c000000_sound.stereo-fallback"
+)
+PACTL = os.getenv("KIOSK_PACTL", "pactl")
 VOLUME_STEP = 5
+# Our own writes echo back through `pactl subscribe`; ignore them for this long.
+AUDIO_ECHO_SECONDS = 0.5
+AUDIO_RESUBSCRIBE_SECONDS = 5.0
+# Presses arriving within this window are merged into one pactl write.
+VOLUME_SETTLE_SECONDS = 0.08
 
 
 def _run(cmd: list[str]) -> str:
@@ -71,50 +246,182 @@ def _run(cmd: list[str]) -> str:
         raise HTTPException(500, (e.stderr or str(e)).strip())
     except subprocess.TimeoutExpired:
         raise HTTPException(500, f"Command timed out: {' '.join(cmd)}")
+    except FileNotFoundError:
+        raise HTTPException(500, f"Command not found: {cmd[0]}")
+
+
+class AudioController:
+    """Keeps the sink's volume and mute state in memory.
+
+    Reads are served from the cache. A long-lived `pactl subscribe` reports
+    changes made by anyone else (desktop mixer, restarted PipeWire) and only
+    those trigger a re-read; our own writes update the cache directly and
+    skip the pactl calls that would not change anything.
+    """
+
+    def __init__(self, pactl: str, sink: str):
+        self.pactl = pactl
+        self.sink = sink
+        self._lock = threading.Lock()
+        self._volume: int | None = None
+        self._muted = False
+        self._last_write = 0.0
+        self._proc: subprocess.Popen[str] | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._watch, name="pactl-subscribe", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+
+    def get(self) -> tuple[int, bool]:
+        with self._lock:
+            if self._volume is None:
+                self._refresh_locked()
+            assert self._volume is not None
+            return self._volume, self._muted
+
+    def apply(self, percent: int, muted: bool) -> tuple[int, bool]:
+        percent = max(0, min(100, percent))
+        with self._lock:
+            if self._volume is None:
+                self._refresh_locked()
+            if percent != self._volume:
+                _run([self.pactl, "set-sink-volume", self.sink, f"{percent}%"])
+                self._volume = percent
+            if muted != self._muted:
+                _run([self.pactl, "set-sink-mute", self.sink, "1" if muted else "0"])
+                self._muted = muted
+            self._last_write = time.monotonic()
+            return percent, muted
+
+    def _refresh_locked(self):
+        out = _run([self.pactl, "get-sink-volume", self.sink])
+        m = re.search(r"(\d+)%", out)
+        if not m:
+            raise HTTPException(500, f"Could not parse volume: {out}")
+        self._volume = int(m.group(1))
+        # `pactl get-sink-mute` prints "Mute: yes" / "Mute: no".
+        mute_out = _run([self.pactl, "get-sink-mute", self.sink])
+        self._muted = mute_out.rpartition(":")[2].strip().lower() in ("yes", "true", "1")
+
+    def _on_external_change(self):
+        with self._lock:
+            if time.monotonic() - self._last_write < AUDIO_ECHO_SECONDS:
+                return
+            before = (self._volume, self._muted)
+            self._refresh_locked()
+            vol, muted = self._volume, self._muted
+        if (vol, muted) != before:
+            sse_send("volume", {"volume_percent": vol, "muted": muted})
+
+    def _watch(self):
+        while not self._stopped.is_set():
+            try:
+                self._proc = subprocess.Popen(
+                    [self.pactl, "subscribe"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                )
+                assert self._proc.stdout is not None
+                for line in self._proc.stdout:
+                    if "'change'" in line and (" sink " in line or " server" in line):
+                        try:
+                            self._on_external_change()
+                        except HTTPException as e:
+                            log.warning("Could not refresh volume: %s", e.detail)
+            except OSError as e:
+                log.warning("pactl subscribe failed: %s", e)
+            # The stream ended: pactl or the sound server went away. Forget the
+            # cache so the next read goes to the server, then resubscribe.
+            with self._lock:
+                self._volume = None
+            self._stopped.wait(AUDIO_RESUBSCRIBE_SECONDS)
+
+
+_audio = AudioController(PACTL, SOUND_SINK)
+# Latest (volume, muted) requested but not yet written. Only touched on the
+# event loop, so the volume endpoints below are async on purpose.
+_volume_command: tuple[int, bool] | None = None
+# The command the worker is writing right now; pactl does not report it yet.
+_volume_applying: tuple[int, bool] | None = None
+_volume_wakeup: asyncio.Event | None = None
+_volume_task: asyncio.Task[None] | None = None
 
 
 def get_volume():
-    out = _run(["pactl", "get-sink-volume", SOUND_SINK])
-    m = re.search(r"(\d+)%", out)
-    vol = int(m.group(1)) if m else None
-    if vol is None:
-        raise HTTPException(500, f"Could not parse volume: {out}")
-    muted = "MUTED" in _run(["pactl", "get-sink-mute", SOUND_SINK])
+    return _audio.get()
+
+
+async def _queue_volume(step: int = 0, toggle_mute: bool = False) -> tuple[int, bool]:
+    """Folds a button press into the pending command and returns its target."""
+    global _volume_command
+    current = None
+    if _volume_command is None and _volume_applying is None:
+        current = await asyncio.to_thread(get_volume)
+    # Re-checked after the await: a concurrent press may have queued meanwhile.
+    base = _volume_command or _volume_applying or current
+    assert base is not None
+    vol, muted = base
+
+    if toggle_mute:
+        muted = not muted
+    else:
+        vol = max(0, min(100, vol + step))
+        muted = vol == 0
+
+    _volume_command = (vol, muted)
+    assert _volume_wakeup is not None
+    _volume_wakeup.set()
     return vol, muted
 
 
-def set_volume_clamped(new_percent: int):
-    new_percent = max(0, min(100, new_percent))
-    _run(["pactl", "set-sink-volume", SOUND_SINK, f"{new_percent}%"])
-    if new_percent > 0:
-        _run(["pactl", "set-sink-mute", SOUND_SINK, "0"])
-    elif new_percent == 0:
-        _run(["pactl", "set-sink-mute", SOUND_SINK, "1"])
+async def _volume_worker():
+    global _volume_command, _volume_applying
+    assert _volume_wakeup is not None
+    while True:
+        await _volume_wakeup.wait()
+        await asyncio.sleep(VOLUME_SETTLE_SECONDS)
+        _volume_wakeup.clear()
+        command, _volume_command = _volume_command, None
+        if command is None:
+            continue
+        _volume_applying = command
+        try:
+            vol, muted = await asyncio.to_thread(_audio.apply, *command)
+        except HTTPException as e:
+            log.warning("Could not set volume: %s", e.detail)
+            continue
+        finally:
+            _volume_applying = None
+        # More presses came in while writing; the next round reports them.
+        if _volume_command is None:
+            sse_send("volume", {"volume_percent": vol, "muted": muted})
 
 
 @api.post("/volume/raise", status_code=202)
-def volume_raise():
-    vol, muted = get_volume()
-    set_volume_clamped(vol + VOLUME_STEP)
-    vol, muted = get_volume()
-    sse_send("volume", {"volume_percent": vol, "muted": muted})
+async def volume_raise():
+    vol, muted = await _queue_volume(step=VOLUME_STEP)
     return {"ok": True, "volume_percent": vol, "muted": muted}
 
 
 @api.post("/volume/lower", status_code=202)
-def volume_lower():
-    vol, muted = get_volume()
-    set_volume_clamped(vol - VOLUME_STEP)
-    vol, muted = get_volume()
-    sse_send("volume", {"volume_percent": vol, "muted": muted})
+async def volume_lower():
+    vol, muted = await _queue_volume(step=-VOLUME_STEP)
     return {"ok": True, "volume_percent": vol, "muted": muted}
 
 
 @api.post("/volume/mute", status_code=202)
-def volume_mute_toggle():
-    _run(["pactl", "set-sink-mute", SOUND_SINK, "toggle"])
-    vol, muted = get_volume()
-    sse_send("volume", {"volume_percent": vol, "muted": muted})
+async def volume_mute_toggle():
+    vol, muted = await _queue_volume(toggle_mute=True)
     return {"ok": True, "volume_percent": vol, "muted": muted}
 
 
@@ -154,14 +461,37 @@ class CallActionIn(BaseModel):
 
 _call_lock = threading.Lock()
 _call: Optional[CallSession] = None
+# Bumped under _call_lock on every change to _call; keys the cached call state.
+_call_version = 0
+
+
+def _call_changed_unlocked():
+    global _call_version
+    _call_version += 1
+
+
+def _call_state_payload_unlocked() -> dict[str, Any]:
+    if not _call:
+        return {"state": CallState.idle.value, "call": None}
+    return {"state": _call.state.value, "call": _call.model_dump(mode="json")}
+
+
+def _call_state_json() -> bytes:
+    with _call_lock:
+        return _cached_json("call", _call_version, _call_state_payload_unlocked)
 
 
 def push_call(session: Optional[CallSession], extra: dict[str, Any] | None = None):
+    # Every call state change may suspend or resume the slideshow.
+    _rearm_slideshow()
+    if not extra:
+        # `session` is the current call, so the cached /call/state body is the payload.
+        sse_send_json("call", _call_state_json())
+        return
     payload: dict[str, Any] = {"state": CallState.idle, "call": None}
     if session is not None:
         payload = {"state": session.state, "call": session.model_dump()}
-    if extra:
-        payload.update(extra)
+    payload.update(extra)
     sse_send("call", payload)
 
 
@@ -177,6 +507,7 @@ def call_initiate(body: CallStartIn):
         if _call and _call.state not in (CallState.idle, CallState.ended):
             raise HTTPException(409, "Already in a call flow")
         _call = CallSession(call_id=body.call_id, state=CallState.outgoing_ringing)
+        _call_changed_unlocked()
 
     push_call(_call)
     return {"ok": True, "call": _call.model_dump()}
@@ -189,6 +520,7 @@ def call_receive(body: CallStartIn):
         if _call and _call.state not in (CallState.idle, CallState.ended):
             raise HTTPException(409, "Busy")
         _call = CallSession(call_id=body.call_id, state=CallState.incoming_ringing)
+        _call_changed_unlocked()
 
     push_call(_call)
     return {"ok": True, "call": _call.model_dump()}
@@ -203,6 +535,7 @@ def call_accept(body: CallActionIn):
         if _call.state != CallState.incoming_ringing:
             raise HTTPException(409, f"Cannot accept from state={_call.state}")
         _call.state = CallState.connecting
+        _call_changed_unlocked()
 
     push_call(_call)
     return {"ok": True, "call": _call.model_dump()}
@@ -218,6 +551,7 @@ def call_decline(body: CallActionIn):
             raise HTTPException(409, f"Cannot decline from state={_call.state}")
         ended_call = _call
         _call = None
+        _call_changed_unlocked()
 
     _touch_slideshow_clock()
     push_call(None, extra={"reason": "declined", "ended_call_id": ended_call.call_id})
@@ -232,6 +566,7 @@ def call_end(body: CallActionIn):
             raise HTTPException(404, "Unknown call_id")
         ended_call = _call
         _call = None
+        _call_changed_unlocked()
 
     _touch_slideshow_clock()
     push_call(None, extra={"reason": "ended", "ended_call_id": ended_call.call_id})
@@ -240,10 +575,7 @@ def call_end(body: CallActionIn):
 
 @api.get("/call/state")
 def call_state():
-    with _call_lock:
-        if not _call:
-            return {"state": CallState.idle, "call": None}
-        return {"state": _call.state, "call": _call.model_dump()}
+    return _json_response(_call_state_json())
 
 
 @api.post("/call/reset", status_code=202)
@@ -251,6 +583,7 @@ def call_reset():
     global _call
     with _call_lock:
         _call = None
+        _call_changed_unlocked()
     _touch_slideshow_clock()
     push_call(None, extra={"reason": "reset"})
     return {"ok": True}
@@ -280,46 +613,412 @@ ALLOWED = {
     "image/png": ".png",
     "image/webp": ".webp",
 }
+MAGIC_BYTES = {
+    b"\xff\xd8\xff": "image/jpeg",
+    b"\x89PNG\r\n\x1a\n": "image/png",
+}
+# "existing" answers a re-upload with the entry that already holds the blob,
+# "reference" adds another playlist entry pointing at the same blob.
+DUPLICATE_UPLOADS = os.getenv("KIOSK_DUPLICATE_UPLOADS", "existing")
+MAX_UPLOAD_BYTES = int(os.getenv("KIOSK_MAX_UPLOAD_BYTES", str(30 * 1024 * 1024)))
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Room for the multipart boundaries and part headers around the file itself.
+UPLOAD_ENVELOPE_BYTES = 64 * 1024
+# The panel's native resolution, e.g. "1920x1080".
+FRAME_SIZE = tuple(int(v) for v in os.getenv("KIOSK_FRAME_SIZE", "1920x1080").split("x"))
+THUMB_SIZE = (320, 320)
+DISPLAY_SIZE = FRAME_SIZE
+RENDITION_QUALITY = 85
+# "off" stores uploads byte for byte; "jpeg" or "webp" store an EXIF-rotated,
+# metadata-free re-encode sized for the frame instead.
+INGEST_FORMAT = os.getenv("KIOSK_INGEST_FORMAT", "off").lower()
+if INGEST_FORMAT not in {"off", "jpeg", "webp"}:
+    raise RuntimeError("KIOSK_INGEST_FORMAT must be one of off, jpeg, webp")
+INGEST_QUALITY = int(os.getenv("KIOSK_INGEST_QUALITY", "88"))
+# With re-encoding on, also keep the upload as sent under originals/.
+KEEP_ORIGINALS = os.getenv("KIOSK_KEEP_ORIGINALS", "0") == "1"
+# Processes for decoding and encoding, so image work never holds the GIL
+# against request handling. 0 falls back to a thread.
+CPU_WORKERS = int(os.getenv("KIOSK_CPU_WORKERS", "1"))
+# Metadata only needs a reduced-scale decode; the placeholder ends up ~1 KB.
+METADATA_DRAFT_SIZE = (128, 128)
+PLACEHOLDER_SIZE = (16, 16)
+PLACEHOLDER_QUALITY = 50
+# Picture ids and hashed asset names never change content.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
 DEFAULT_INTERVAL_SECONDS = 30
 MIN_INTERVAL_SECONDS = 5
 MAX_INTERVAL_SECONDS = 3600
+# How many upcoming pictures the kiosk is told to preload.
+PREFETCH_COUNT = int(os.getenv("KIOSK_PREFETCH_COUNT", "3"))
+PREFETCH_MAX_COUNT = 20
+# How many id-level playlist changes are kept for ?since= deltas; older
+# clients get the full list.
+PLAYLIST_CHANGELOG_SIZE = 256
+PLAYLIST_PAGE_MAX = 500
 
 PICTURE_DIR = Path(__file__).parent / "pics"
 PICTURE_DIR.mkdir(exist_ok=True)
 LEGACY_META_PATH = PICTURE_DIR / "current.json"
 PLAYLIST_PATH = PICTURE_DIR / "playlist.json"
+PLAYLIST_DB_PATH = PICTURE_DIR / "playlist.db"
+VOLATILE_FLUSH_SECONDS = 60
+RENDITION_DIR = PICTURE_DIR / "renditions"
+ORIGINALS_DIR = PICTURE_DIR / "originals"
+QUARANTINE_DIR = PICTURE_DIR / "quarantine"
+RENDITION_DIR.mkdir(exist_ok=True)
+# The integrity scan checks playlist entries against the disk and collects
+# files nothing references, a batch at a time so it never hogs the SD card.
+INTEGRITY_SCAN_SECONDS = int(os.getenv("KIOSK_INTEGRITY_SCAN_SECONDS", "21600"))
+INTEGRITY_SCAN_DELAY_SECONDS = 60
+INTEGRITY_SCAN_BATCH = 64
+INTEGRITY_SCAN_PAUSE_SECONDS = 0.2
+# Unreferenced files younger than this are left alone: an upload has its blob
+# on disk shortly before the playlist references it.
+ORPHAN_GRACE_SECONDS = int(os.getenv("KIOSK_ORPHAN_GRACE_SECONDS", "3600"))
+# "quarantine" moves orphaned pictures to QUARANTINE_DIR, "delete" removes
+# them. Temp files and renditions can always be recreated and are deleted.
+ORPHAN_ACTION = os.getenv("KIOSK_ORPHAN_ACTION", "quarantine").lower()
+if ORPHAN_ACTION not in {"quarantine", "delete"}:
+    raise RuntimeError("KIOSK_ORPHAN_ACTION must be one of quarantine, delete")
+QUARANTINE_RETENTION_SECONDS = 7 * 24 * 3600
+INTEGRITY_REPORT_MAX_FILES = 100
+# Bytes the picture library may occupy (blobs, renditions, kept originals);
+# 0 disables the budget. Uploads evict unpinned pictures to fit, picked by
+# KIOSK_EVICTION_POLICY: "oldest" uploaded, "lru" (least recently shown) or
+# "largest". The picture on screen is never evicted.
+STORAGE_BUDGET_BYTES = int(os.getenv("KIOSK_STORAGE_BUDGET_BYTES", "0"))
+EVICTION_POLICY = os.getenv("KIOSK_EVICTION_POLICY", "oldest").lower()
+if EVICTION_POLICY not in {"oldest", "lru", "largest"}:
+    raise RuntimeError("KIOSK_EVICTION_POLICY must be one of oldest, lru, largest")
+EVICTIONS_REPORTED = 20
 
 app.mount("/pics", StaticFiles(directory=str(PICTURE_DIR)), name="pics")
 
 
+class UploadLimitMiddleware:
+    """Rejects oversized uploads before the multipart body is spooled."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] != "/api/picture":
+            await self.app(scope, receive, send)
+            return
+
+        limit = MAX_UPLOAD_BYTES + UPLOAD_ENVELOPE_BYTES
+        headers = dict(scope["headers"])
+        try:
+            declared = int(headers.get(b"content-length", b"-1"))
+        except ValueError:
+            declared = -1
+        if declared > limit:
+            response = JSONResponse({"detail": "Upload too large"}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise HTTPException(413, "Upload too large")
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+app.add_middleware(UploadLimitMiddleware)
+
+
 class PictureEntry(BaseModel):
+    # Shared between playlist snapshots, so changes go through model_copy().
+    model_config = ConfigDict(frozen=True)
+
     picture_id: str
     filename: str
     original_filename: str
     content_type: str
     uploaded_at: int
+    sha256: str | None = None
+    thumb_filename: str | None = None
+    display_filename: str | None = None
+    sort_key: float = 0.0
+    # Computed once from the blob; width/height are as displayed (EXIF-rotated).
+    width: int | None = None
+    height: int | None = None
+    orientation: int = 1
+    dominant_color: str | None = None
+    placeholder: str | None = None
+    # Bytes on disk for the blob, its renditions and any kept original.
+    size_bytes: int | None = None
+    # Pinned pictures are never evicted to fit the storage budget.
+    pinned: bool = False
+
+
+PICTURE_METADATA_FIELDS = {"width", "height", "orientation", "dominant_color", "placeholder"}
+
+
+class PlaylistIndex:
+    """Pictures ordered by `sort_key`.
+
+    Lookup by id is a dict hit and positions are found by bisecting the sorted
+    keys, so reads never walk the whole playlist. Moving a picture gives it a
+    key between its new neighbours, which touches only that one entry.
+
+    An index that is part of a published snapshot is never mutated: writers
+    change a copy() and publish that. The copy duplicates the id map and the
+    two lists, so a write is still linear, but only in flat C-level copies:
+    the per-blob id sets are shared and a write copies just the one it touches.
+    """
+
+    def __init__(self, images: Iterable[PictureEntry] = ()):
+        self._by_id: dict[str, PictureEntry] = {}
+        self._by_sha256: dict[str, dict[str, None]] = {}
+        # Blobs whose id set belongs to this index rather than the one it was copied from.
+        self._own_blobs: set[str] = set()
+        self._keys: list[float] = []
+        self._ids: list[str] = []
+        for image in images:
+            if image.picture_id in self._by_id:
+                continue
+            self._add(image, len(self._ids))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[PictureEntry]:
+        by_id = self._by_id
+        return (by_id[picture_id] for picture_id in self._ids)
+
+    def __contains__(self, picture_id: object) -> bool:
+        return picture_id in self._by_id
+
+    def copy(self) -> "PlaylistIndex":
+        clone = PlaylistIndex()
+        clone._by_id = dict(self._by_id)
+        clone._by_sha256 = dict(self._by_sha256)
+        clone._keys = list(self._keys)
+        clone._ids = list(self._ids)
+        return clone
+
+    def _add(self, image: PictureEntry, position: int):
+        self._by_id[image.picture_id] = image
+        self._keys.insert(position, image.sort_key)
+        self._ids.insert(position, image.picture_id)
+        if image.sha256:
+            self._blob_ids(image.sha256)[image.picture_id] = None
+
+    def _blob_ids(self, sha256: str) -> dict[str, None]:
+        """The id set of a blob, ready to be changed; copied first if it is shared."""
+        ids = self._by_sha256.get(sha256)
+        if ids is None or sha256 not in self._own_blobs:
+            ids = dict(ids or {})
+            self._by_sha256[sha256] = ids
+            self._own_blobs.add(sha256)
+        return ids
+
+    def ensure_ordered_keys(self) -> bool:
+        """Renumbers keys that are not strictly increasing; True if any changed."""
+        keys = self._keys
+        if all(a < b for a, b in zip(keys, keys[1:])):
+            return False
+        self._renumber()
+        return True
+
+    def _renumber(self):
+        for position, picture_id in enumerate(self._ids):
+            image = self._by_id[picture_id]
+            self._by_id[picture_id] = image.model_copy(update={"sort_key": float(position)})
+            self._keys[position] = float(position)
+
+    def get(self, picture_id: str | None) -> PictureEntry | None:
+        if picture_id is None:
+            return None
+        return self._by_id.get(picture_id)
+
+    def find_sha256(self, sha256: str) -> PictureEntry | None:
+        ids = self._by_sha256.get(sha256)
+        if not ids:
+            return None
+        return self._by_id[next(iter(ids))]
+
+    def at(self, position: int) -> PictureEntry:
+        return self._by_id[self._ids[position]]
+
+    def position(self, picture_id: str | None) -> int | None:
+        image = self.get(picture_id)
+        if image is None:
+            return None
+        return bisect.bisect_left(self._keys, image.sort_key)
+
+    def page(self, after_key: float | None, limit: int) -> tuple[list[PictureEntry], bool]:
+        """Up to `limit` entries with a sort key above `after_key`, and whether more follow."""
+        start = 0 if after_key is None else bisect.bisect_right(self._keys, after_key)
+        ids = self._ids[start : start + limit]
+        return [self._by_id[picture_id] for picture_id in ids], start + limit < len(self._ids)
+
+    def append(self, image: PictureEntry) -> PictureEntry:
+        """Adds `image` at the end and returns it re-keyed."""
+        image = image.model_copy(update={"sort_key": self._keys[-1] + 1.0 if self._keys else 0.0})
+        self._add(image, len(self._ids))
+        return image
+
+    def replace(self, image: PictureEntry):
+        """Swaps in an updated copy of an entry; its position is unchanged."""
+        current = self._by_id[image.picture_id]
+        if image.sort_key != current.sort_key or image.sha256 != current.sha256:
+            raise ValueError("replace() cannot move or re-hash an entry")
+        self._by_id[image.picture_id] = image
+
+    def remove(self, picture_id: str) -> tuple[PictureEntry, int]:
+        position = self.position(picture_id)
+        if position is None:
+            raise KeyError(picture_id)
+        image = self._by_id.pop(picture_id)
+        del self._keys[position]
+        del self._ids[position]
+        if image.sha256:
+            same_blob = self._blob_ids(image.sha256)
+            same_blob.pop(picture_id, None)
+            if not same_blob:
+                del self._by_sha256[image.sha256]
+                self._own_blobs.discard(image.sha256)
+        return image, position
+
+    def move(self, picture_id: str, before_picture_id: str | None) -> list[PictureEntry]:
+        """Moves a picture in front of another (or to the end); returns re-keyed entries."""
+        if before_picture_id is not None and before_picture_id not in self._by_id:
+            raise KeyError(before_picture_id)
+        if before_picture_id == picture_id:
+            return []
+        image, _ = self.remove(picture_id)
+
+        if before_picture_id is None:
+            position = len(self._ids)
+            low = self._keys[-1] if self._keys else -1.0
+            high = low + 2.0
+        else:
+            position = bisect.bisect_left(self._keys, self._by_id[before_picture_id].sort_key)
+            high = self._keys[position]
+            low = self._keys[position - 1] if position > 0 else high - 2.0
+
+        key = (low + high) / 2
+        image = image.model_copy(update={"sort_key": key})
+        self._add(image, position)
+        if low < key < high:
+            return [image]
+
+        # Float precision between the neighbours is exhausted; spread them out.
+        self._renumber()
+        return list(self)
+
+
+class PlaylistChange(BaseModel):
+    """Picture ids touched by the write that published `version`."""
+
+    model_config = ConfigDict(frozen=True)
+
+    version: int
+    added: frozenset[str] = frozenset()
+    changed: frozenset[str] = frozenset()
+    removed: frozenset[str] = frozenset()
 
 
 class PlaylistState(BaseModel):
-    images: list[PictureEntry] = Field(default_factory=list)
+    """One immutable, versioned snapshot of the playlist.
+
+    Readers use whatever `_playlist_state` points at without locking; writers
+    build the next snapshot under `_playlist_lock` and swap it in whole.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    # Milliseconds-based so it keeps increasing across restarts.
+    version: int = Field(default_factory=lambda: time.time_ns() // 1_000_000)
+    # Recent id-level changes, complete for every version after changelog_since.
+    changelog: tuple[PlaylistChange, ...] = ()
+    changelog_since: int = 0
+    images: PlaylistIndex = Field(default_factory=PlaylistIndex)
     current_picture_id: str | None = None
     interval_seconds: int = DEFAULT_INTERVAL_SECONDS
     last_switch_at: float = Field(default_factory=lambda: time.time())
 
+    @field_validator("images", mode="before")
+    @classmethod
+    def _index_images(cls, value: Any) -> Any:
+        if isinstance(value, PlaylistIndex):
+            return value
+        return PlaylistIndex(
+            image if isinstance(image, PictureEntry) else PictureEntry.model_validate(image)
+            for image in value
+        )
+
+
+class PictureMoveIn(BaseModel):
+    before_picture_id: str | None = None
+
+
+class PicturePinIn(BaseModel):
+    pinned: bool
+
 
 class SlideshowIn(BaseModel):
     interval_seconds: int = Field(ge=MIN_INTERVAL_SECONDS, le=MAX_INTERVAL_SECONDS)
 
 
-_playlist_lock = threading.Lock()
+# Serializes writers only; readers never take it. Re-entrant so a writer may
+# trigger the lazy first load.
+_playlist_lock = threading.RLock()
 _playlist_state: PlaylistState | None = None
+_blob_refs: dict[str, int] = {}
+# Storage accounting, kept in step with _blob_refs: bytes per referenced blob
+# and their total, plus what uploads in flight have set aside.
+_blob_sizes: dict[str, int] = {}
+_storage_used = 0
+_storage_reserved = 0
+_recent_evictions: deque[dict[str, Any]] = deque(maxlen=EVICTIONS_REPORTED)
+# When each picture was last on screen, for the "lru" eviction policy. Volatile
+# like the slideshow position: written out by _flush_volatile().
+_last_shown_at: dict[str, float] = {}
+_last_shown_dirty: set[str] = set()
+# Orders committing a blob against unlinking it, see _commit_blob().
+_blob_lock = threading.Lock()
+_db: sqlite3.Connection | None = None
+_db_lock = threading.Lock()
+_persist_queue: "queue.Queue[Callable[[], None]]" = queue.Queue()
+_persist_thread: threading.Thread | None = None
+# Newest snapshot version whose settings row is on disk.
+_persisted_version = 0
+_volatile_flush_task: asyncio.Task[None] | None = None
 _slideshow_task: asyncio.Task[None] | None = None
+_slideshow_wakeup: asyncio.Event | None = None
+_rendition_queue: asyncio.Queue[str] | None = None
+_rendition_task: asyncio.Task[None] | None = None
+_cpu_pool: ProcessPoolExecutor | None = None
+_integrity_task: asyncio.Task[None] | None = None
+_integrity_wakeup: asyncio.Event | None = None
+_integrity_running = False
+_integrity_last: dict[str, Any] | None = None
 
 
 def _picture_url(picture_id: str) -> str:
     return f"/api/pictures/{picture_id}/file"
 
 
+def _thumb_url(picture_id: str) -> str:
+    return f"/api/pictures/{picture_id}/thumb"
+
+
+def _display_url(picture_id: str) -> str:
+    return f"/api/pictures/{picture_id}/display"
+
+
 def _guess_content_type(path: Path, hinted: str | None = None) -> str:
     if hinted in ALLOWED:
         return str(hinted)
@@ -329,6 +1028,56 @@ def _guess_content_type(path: Path, hinted: str | None = None) -> str:
     return "application/octet-stream"
 
 
+def _sniff_content_type(head: bytes) -> str | None:
+    for magic, content_type in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def _receive_upload(src: BinaryIO) -> tuple[Path, str, str]:
+    """Copies an upload to a `.upload_*` temp file; runs in a worker thread.
+
+    Returns the temp path, the sniffed content type and the SHA-256 hex digest.
+    """
+    head = src.read(UPLOAD_CHUNK_SIZE)
+    content_type = _sniff_content_type(head)
+    if content_type is None:
+        raise HTTPException(415, "Unsupported image type")
+
+    tmp = PICTURE_DIR / f".upload_{uuid.uuid4().hex}{ALLOWED[content_type]}"
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with tmp.open("wb") as out:
+            chunk = head
+            while chunk:
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    raise HTTPException(413, "Upload too large")
+                digest.update(chunk)
+                out.write(chunk)
+                chunk = src.read(UPLOAD_CHUNK_SIZE)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return tmp, content_type, digest.hexdigest()
+
+
+def _commit_upload(tmp: Path, dst: Path):
+    # Deferred until here so that duplicates never pay for the fsync.
+    with tmp.open("rb+") as f:
+        os.fsync(f.fileno())
+    tmp.replace(dst)
+    dir_fd = os.open(dst.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
 def _sanitize_original_filename(name: str | None, ext: str) -> str:
     raw = Path(name or f"picture{ext}").name
     return raw or f"picture{ext}"
@@ -365,49 +1114,260 @@ def _find_legacy_picture() -> tuple[Path, str, str] | None:
     return path, content_type, path.name
 
 
-def _persist_playlist_unlocked():
-    state = _playlist_state
-    if state is None:
-        return
-    PLAYLIST_PATH.write_text(state.model_dump_json(indent=2), encoding="utf-8")
+#
+# Playlist persistence
+#
+# SQLite in WAL mode: one row per picture plus a small settings table, so an
+# upload or delete is a single-row transaction instead of a full rewrite.
+# current_picture_id and last_switch_at change on every slideshow tick; they
+# are only published in memory and flushed every VOLATILE_FLUSH_SECONDS, at
+# shutdown, or together with the next durable write. All writes run on one
+# thread in submission order, so writers never hold _playlist_lock across I/O.
+#
 
+_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pictures (
+    picture_id TEXT PRIMARY KEY,
+    sort_key REAL NOT NULL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pictures_sort_key ON pictures (sort_key);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS shown (
+    picture_id TEXT PRIMARY KEY,
+    last_shown_at REAL NOT NULL
+);
+"""
+
+
+def _require_db() -> sqlite3.Connection:
+    global _db
+    if _db is None:
+        conn = sqlite3.connect(PLAYLIST_DB_PATH, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=FULL")
+        conn.executescript(_DB_SCHEMA)
+        _db = conn
+    return _db
+
+
+def _close_db():
+    global _db
+    with _db_lock:
+        if _db is None:
+            return
+        _db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        _db.close()
+        _db = None
+
+
+def _db_load_state() -> PlaylistState | None:
+    with _db_lock:
+        db = _require_db()
+        settings = dict(db.execute("SELECT key, value FROM settings").fetchall())
+        if "interval_seconds" not in settings:
+            return None
+        rows = db.execute("SELECT entry FROM pictures ORDER BY sort_key").fetchall()
 
-def _normalize_playlist_unlocked() -> bool:
-    global _playlist_state
-    state = _playlist_state
-    if state is None:
-        return False
+    return PlaylistState(
+        images=[PictureEntry.model_validate_json(row[0]) for row in rows],
+        current_picture_id=settings.get("current_picture_id") or None,
+        interval_seconds=int(settings["interval_seconds"]),
+        last_switch_at=float(settings.get("last_switch_at", 0)),
+    )
 
-    changed = False
-    normalized_images: list[PictureEntry] = []
-    seen_ids: set[str] = set()
+
+def _db_load_shown() -> dict[str, float]:
+    with _db_lock:
+        return dict(_require_db().execute("SELECT picture_id, last_shown_at FROM shown").fetchall())
+
+
+def _write_settings(db: sqlite3.Connection, state: PlaylistState):
+    db.executemany(
+        "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+        [
+            ("interval_seconds", str(state.interval_seconds)),
+            ("current_picture_id", state.current_picture_id or ""),
+            ("last_switch_at", repr(state.last_switch_at)),
+        ],
+    )
+
+
+def _persist_worker():
+    while True:
+        job = _persist_queue.get()
+        try:
+            job()
+        finally:
+            _persist_queue.task_done()
+
+
+def _submit_persist_unlocked(func: Callable[..., Any], *args: Any) -> Future:
+    """Queues disk work behind everything submitted before it.
+
+    Called with `_playlist_lock` held so the queue order matches the order
+    snapshots were published in; wait on the returned future after releasing it.
+    """
+    global _persist_thread
+    if _persist_thread is None or not _persist_thread.is_alive():
+        _persist_thread = threading.Thread(target=_persist_worker, name="playlist-persist", daemon=True)
+        _persist_thread.start()
+
+    future: Future = Future()
+
+    def job():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    _persist_queue.put(job)
+    return future
+
+
+def _persist_state(state: PlaylistState, *statements: tuple[str, tuple[Any, ...]]):
+    """Runs `statements` and the snapshot's settings as one transaction."""
+    global _persisted_version
+    with _db_lock:
+        db = _require_db()
+        with db:
+            db.execute("BEGIN")
+            for sql, params in statements:
+                db.execute(sql, params)
+            _write_settings(db, state)
+        _persisted_version = max(_persisted_version, state.version)
+
+
+def _shown_statements_unlocked() -> list[tuple[str, tuple[Any, ...]]]:
+    rows = [(picture_id, _last_shown_at[picture_id]) for picture_id in _last_shown_dirty]
+    _last_shown_dirty.clear()
+    return [("INSERT OR REPLACE INTO shown (picture_id, last_shown_at) VALUES (?, ?)", row) for row in rows]
+
+
+def _persist_state_unlocked(state: PlaylistState) -> Future:
+    return _submit_persist_unlocked(_persist_state, state, *_shown_statements_unlocked())
+
+
+def _persist_full_playlist_unlocked(state: PlaylistState) -> Future:
+    statements: list[tuple[str, tuple[Any, ...]]] = [("DELETE FROM pictures", ())]
     for image in state.images:
-        if image.picture_id in seen_ids:
-            changed = True
-            continue
-        if not (PICTURE_DIR / image.filename).is_file():
-            changed = True
-            continue
-        normalized_images.append(image)
-        seen_ids.add(image.picture_id)
+        statements.append(
+            (
+                "INSERT INTO pictures (picture_id, sort_key, entry) VALUES (?, ?, ?)",
+                (image.picture_id, image.sort_key, image.model_dump_json()),
+            )
+        )
+    statements.append(("DELETE FROM shown WHERE picture_id NOT IN (SELECT picture_id FROM pictures)", ()))
+    return _submit_persist_unlocked(_persist_state, state, *statements)
+
+
+def _persist_pictures_unlocked(state: PlaylistState, *images: PictureEntry) -> Future:
+    return _submit_persist_unlocked(
+        _persist_state,
+        state,
+        *(
+            (
+                "INSERT OR REPLACE INTO pictures (picture_id, sort_key, entry) VALUES (?, ?, ?)",
+                (image.picture_id, image.sort_key, image.model_dump_json()),
+            )
+            for image in images
+        ),
+    )
+
+
+def _persist_removal_unlocked(state: PlaylistState, picture_id: str) -> Future:
+    return _submit_persist_unlocked(
+        _persist_state,
+        state,
+        ("DELETE FROM pictures WHERE picture_id = ?", (picture_id,)),
+        ("DELETE FROM shown WHERE picture_id = ?", (picture_id,)),
+    )
+
+
+def _flush_volatile():
+    with _playlist_lock:
+        state = _playlist_state
+        if state is None or (state.version <= _persisted_version and not _last_shown_dirty):
+            return
+        future = _persist_state_unlocked(state)
+    future.result()
 
-    if len(normalized_images) != len(state.images):
-        state.images = normalized_images
+
+def _drain_persistence():
+    _persist_queue.join()
+
+
+async def _volatile_flush_worker():
+    while True:
+        await asyncio.sleep(VOLATILE_FLUSH_SECONDS)
+        try:
+            await asyncio.to_thread(_flush_volatile)
+        except Exception:
+            log.exception("Could not flush slideshow position")
+
+
+def _publish_unlocked(
+    state: PlaylistState,
+    *,
+    added: Iterable[str] = (),
+    changed: Iterable[str] = (),
+    removed: Iterable[str] = (),
+    **changes: Any,
+) -> PlaylistState:
+    """Swaps in the next snapshot; readers see either the old one or this one, whole.
+
+    `added`, `changed` and `removed` name the picture ids the write touched,
+    for ?since= deltas. Only changes the in-memory view: durable fields still
+    need a _persist_* call, while current_picture_id and last_switch_at may be
+    left to _flush_volatile().
+    """
+    global _playlist_state
+    outgoing = state.current_picture_id
+    if outgoing and changes.get("current_picture_id", outgoing) != outgoing:
+        # The outgoing picture was on screen until now.
+        _last_shown_at[outgoing] = time.time()
+        _last_shown_dirty.add(outgoing)
+    version = max(state.version + 1, time.time_ns() // 1_000_000)
+    change = PlaylistChange(
+        version=version, added=frozenset(added), changed=frozenset(changed), removed=frozenset(removed)
+    )
+    if change.added or change.changed or change.removed:
+        changelog = (*state.changelog, change)
+        changelog_since = state.changelog_since
+        if len(changelog) > PLAYLIST_CHANGELOG_SIZE:
+            changelog_since = changelog[0].version
+            changelog = changelog[1:]
+        changes.update(changelog=changelog, changelog_since=changelog_since)
+    state = state.model_copy(update={**changes, "version": version})
+    _playlist_state = state
+    return state
+
+
+def _normalize_playlist(state: PlaylistState) -> tuple[PlaylistState, bool]:
+    changes: dict[str, Any] = {}
+    images = state.images.copy()
+    # Entries whose files are gone are pruned by the integrity scan, so
+    # loading never touches the disk once per picture.
+    if images.ensure_ordered_keys():
+        changes["images"] = images
 
     if not (MIN_INTERVAL_SECONDS <= state.interval_seconds <= MAX_INTERVAL_SECONDS):
-        state.interval_seconds = DEFAULT_INTERVAL_SECONDS
-        changed = True
+        changes["interval_seconds"] = DEFAULT_INTERVAL_SECONDS
 
-    valid_current_ids = {image.picture_id for image in state.images}
-    if state.current_picture_id not in valid_current_ids:
-        state.current_picture_id = state.images[0].picture_id if state.images else None
-        changed = True
+    if state.current_picture_id not in images:
+        changes["current_picture_id"] = images.at(0).picture_id if images else None
 
     if state.last_switch_at <= 0:
-        state.last_switch_at = time.time()
-        changed = True
+        changes["last_switch_at"] = time.time()
 
-    return changed
+    if not changes:
+        return state, False
+    return state.model_copy(update=changes), True
 
 
 def _migrate_legacy_picture() -> PlaylistState:
@@ -443,26 +1403,254 @@ def _migrate_legacy_picture() -> PlaylistState:
 
 
 def _load_playlist_state() -> PlaylistState:
-    if PLAYLIST_PATH.is_file():
+    global _playlist_state, _persisted_version, _last_shown_at
+    migrated_json = False
+    state = _db_load_state()
+    if state is None and PLAYLIST_PATH.is_file():
         try:
             state = PlaylistState.model_validate_json(PLAYLIST_PATH.read_text(encoding="utf-8"))
+            migrated_json = True
         except Exception:
-            state = PlaylistState()
-    else:
+            state = None
+    if state is None:
         state = _migrate_legacy_picture()
+        migrated_json = True
 
-    global _playlist_state
+    state, normalized = _normalize_playlist(state)
+    # Nothing from before this start is in the changelog.
+    state = state.model_copy(update={"changelog": (), "changelog_since": state.version})
     _playlist_state = state
-    if _normalize_playlist_unlocked() or not PLAYLIST_PATH.exists():
-        _persist_playlist_unlocked()
-    return _playlist_state
+    _persisted_version = state.version
+    if normalized or migrated_json:
+        _persist_full_playlist_unlocked(state).result()
+    if migrated_json and PLAYLIST_PATH.is_file():
+        PLAYLIST_PATH.replace(PLAYLIST_PATH.with_name(f"{PLAYLIST_PATH.name}.migrated"))
+    _last_shown_at = _db_load_shown()
+    _rebuild_blob_refs_unlocked(state)
+    return state
+
+
+def _rebuild_blob_refs_unlocked(state: PlaylistState):
+    global _storage_used
+    _blob_refs.clear()
+    _blob_sizes.clear()
+    for image in state.images:
+        _blob_refs[image.filename] = _blob_refs.get(image.filename, 0) + 1
+        # Sizes missing from older entries are filled in by the rendition worker.
+        if image.size_bytes is not None:
+            _blob_sizes[image.filename] = image.size_bytes
+    _storage_used = sum(_blob_sizes.values())
+
+
+def _account_blob_unlocked(filename: str, size: int):
+    """Records the bytes stored for a referenced blob."""
+    global _storage_used
+    if filename in _blob_refs:
+        _storage_used += size - _blob_sizes.get(filename, 0)
+        _blob_sizes[filename] = size
+
+
+def _release_blob_unlocked(image: PictureEntry) -> bool:
+    """Drops one reference to the entry's blob; True when it was the last."""
+    global _storage_used
+    remaining = _blob_refs.get(image.filename, 0) - 1
+    if remaining > 0:
+        _blob_refs[image.filename] = remaining
+        return False
+    _blob_refs.pop(image.filename, None)
+    _storage_used -= _blob_sizes.pop(image.filename, 0)
+    return True
+
+
+def _commit_blob(tmp: Path, filename: str, size: int):
+    """Moves an upload into place and takes a reference on it; runs in a worker thread.
+
+    Both happen under `_blob_lock`, so a concurrent _unlink_unreferenced() for
+    the same content hash cannot remove the file in between. `size` is what
+    the blob occupies, kept original included.
+    """
+    with _blob_lock:
+        _commit_upload(tmp, PICTURE_DIR / filename)
+        with _playlist_lock:
+            _blob_refs[filename] = _blob_refs.get(filename, 0) + 1
+            _account_blob_unlocked(filename, size)
+
+
+def _unlink_unreferenced(filename: str, paths: Iterable[Path]):
+    """Removes a blob's files unless something references it again; runs in a worker thread."""
+    with _blob_lock:
+        with _playlist_lock:
+            if filename in _blob_refs:
+                return
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+
+def _remove_picture_unlocked(
+    state: PlaylistState, picture_id: str
+) -> tuple[PlaylistState, PictureEntry, bool, Future]:
+    """Publishes `state` without the picture and queues the removal.
+
+    Returns the new snapshot, the removed entry, whether that dropped the last
+    reference to its blob, and the persist future to wait on after unlocking.
+    """
+    was_current = state.current_picture_id == picture_id
+    images = state.images.copy()
+    image, idx = images.remove(picture_id)
+    last_reference = _release_blob_unlocked(image)
+
+    changes: dict[str, Any] = {"images": images}
+    if not images:
+        changes["current_picture_id"] = None
+    elif was_current:
+        next_idx = idx if idx < len(images) else 0
+        changes["current_picture_id"] = images.at(next_idx).picture_id
+    elif state.current_picture_id not in images:
+        changes["current_picture_id"] = images.at(0).picture_id
+    if "current_picture_id" in changes:
+        changes["last_switch_at"] = time.time()
+
+    state = _publish_unlocked(state, removed=[picture_id], **changes)
+    _last_shown_at.pop(picture_id, None)
+    _last_shown_dirty.discard(picture_id)
+    return state, image, last_reference, _persist_removal_unlocked(state, picture_id)
+
+
+def _blob_paths(image: PictureEntry) -> list[Path]:
+    """Every file stored for the entry's blob, for _unlink_unreferenced()."""
+    return [
+        PICTURE_DIR / image.filename,
+        *(PICTURE_DIR / name for name in (image.thumb_filename, image.display_filename) if name),
+        # Kept originals share the blob's stem but keep their own extension.
+        *ORIGINALS_DIR.glob(f"{Path(image.filename).stem}.*"),
+    ]
+
+
+def _eviction_victims_unlocked(state: PlaylistState, spare: str | None = None) -> list[PictureEntry]:
+    """The pictures to evict next: every entry of one blob, so that its bytes are freed.
+
+    Blobs still referenced by a pinned picture, the one on screen or `spare`
+    are left alone, and so are those that would free nothing. Empty when
+    nothing may be evicted.
+    """
+    groups: dict[str, list[PictureEntry]] = {}
+    for image in state.images:
+        groups.setdefault(image.filename, []).append(image)
+    keep = {state.current_picture_id, spare}
+    candidates = [
+        group
+        for filename, group in groups.items()
+        if _blob_sizes.get(filename, 0) > 0
+        and not any(image.pinned or image.picture_id in keep for image in group)
+    ]
+    if not candidates:
+        return []
+    if EVICTION_POLICY == "largest":
+        return max(candidates, key=lambda group: _blob_sizes[group[0].filename])
+    if EVICTION_POLICY == "lru":
+        # Pictures never shown count as shown when they were uploaded.
+        return min(
+            candidates,
+            key=lambda group: max(
+                _last_shown_at.get(image.picture_id, float(image.uploaded_at)) for image in group
+            ),
+        )
+    return min(candidates, key=lambda group: max((image.uploaded_at, image.sort_key) for image in group))
+
+
+def _make_room(nbytes: int, *, reserve: bool = False, spare: str | None = None) -> bool:
+    """Evicts pictures until `nbytes` more fit the budget; runs in a worker thread.
+
+    With `reserve` the bytes are then set aside for an upload. `spare` is
+    never evicted. Returns False when evicting everything that may be evicted
+    is not enough.
+    """
+    global _storage_reserved
+    while True:
+        with _playlist_lock:
+            previous = state = _require_playlist_state()
+            needed = _storage_used + _storage_reserved + nbytes
+            if STORAGE_BUDGET_BYTES <= 0 or needed <= STORAGE_BUDGET_BYTES:
+                if reserve:
+                    _storage_reserved += nbytes
+                return True
+            victims = _eviction_victims_unlocked(previous, spare)
+            if not victims:
+                return False
+            freed = _blob_sizes[victims[0].filename]
+            evictions = []
+            removals = []
+            for n, victim in enumerate(victims, 1):
+                eviction = {
+                    "picture_id": victim.picture_id,
+                    "filename": victim.original_filename,
+                    # Only dropping the blob's last reference frees its bytes.
+                    "size_bytes": freed if n == len(victims) else 0,
+                    "policy": EVICTION_POLICY,
+                    "evicted_at": time.time(),
+                }
+                # Recorded before publishing so the listing of the new version has it.
+                _recent_evictions.append(eviction)
+                evictions.append(eviction)
+                state, image, last_reference, persisted = _remove_picture_unlocked(state, victim.picture_id)
+                removals.append((image, last_reference, persisted))
+
+        for image, last_reference, persisted in removals:
+            persisted.result()
+            if last_reference:
+                _unlink_unreferenced(image.filename, _blob_paths(image))
+            log.info("Evicted picture %s to fit the storage budget", image.picture_id)
+        _announce_removal(previous, state)
+        for eviction in evictions:
+            sse_send("picture_evicted", eviction)
+
+
+def _reserve_storage(nbytes: int):
+    """Sets `nbytes` aside for an upload, evicting pictures to fit the budget; runs in a worker thread.
+
+    Raises 507 when evicting everything that may be evicted is not enough.
+    Hand the bytes back with _release_storage() once the blob is committed
+    (it is counted as used from then on) or the upload is abandoned.
+    """
+    if 0 < STORAGE_BUDGET_BYTES < nbytes:
+        raise HTTPException(507, "Picture is larger than the storage budget")
+    if not _make_room(nbytes, reserve=True):
+        raise HTTPException(507, "Storage budget is full; unpin or delete pictures")
+
+
+def _release_storage(nbytes: int):
+    global _storage_reserved
+    with _playlist_lock:
+        _storage_reserved -= nbytes
+
+
+def _storage_payload() -> dict[str, Any]:
+    return {
+        "budget_bytes": STORAGE_BUDGET_BYTES or None,
+        "used_bytes": _storage_used,
+        "eviction_policy": EVICTION_POLICY,
+        "recent_evictions": list(_recent_evictions),
+    }
+
+
+def _stored_bytes(image: PictureEntry) -> int:
+    """What the entry's files occupy on disk; runs in a worker thread."""
+    total = 0
+    for path in _blob_paths(image):
+        try:
+            total += path.stat().st_size
+        except FileNotFoundError:
+            pass
+    return total
 
 
 def _require_playlist_state() -> PlaylistState:
-    global _playlist_state
-    if _playlist_state is None:
-        return _load_playlist_state()
-    return _playlist_state
+    """The current snapshot; safe to read without `_playlist_lock`."""
+    state = _playlist_state
+    if state is None:
+        with _playlist_lock:
+            state = _playlist_state or _load_playlist_state()
+    return state
 
 
 def _image_payload(image: PictureEntry) -> dict[str, Any]:
@@ -472,23 +1660,21 @@ def _image_payload(image: PictureEntry) -> dict[str, Any]:
         "content_type": image.content_type,
         "uploaded_at": image.uploaded_at,
         "url": _picture_url(image.picture_id),
+        "thumb_url": _thumb_url(image.picture_id),
+        "display_url": _display_url(image.picture_id),
+        "sort_key": image.sort_key,
+        "size_bytes": image.size_bytes,
+        "pinned": image.pinned,
+        **image.model_dump(include=PICTURE_METADATA_FIELDS),
     }
 
 
-def _current_entry_unlocked() -> PictureEntry | None:
-    state = _require_playlist_state()
-    current_id = state.current_picture_id
-    if not current_id:
-        return None
-    for image in state.images:
-        if image.picture_id == current_id:
-            return image
-    return None
+def _current_entry(state: PlaylistState) -> PictureEntry | None:
+    return state.images.get(state.current_picture_id)
 
 
-def _current_picture_payload_unlocked() -> dict[str, Any]:
-    image = _current_entry_unlocked()
-    state = _require_playlist_state()
+def _current_picture_payload(state: PlaylistState) -> dict[str, Any]:
+    image = _current_entry(state)
     if image is None:
         return {
             "empty": True,
@@ -497,6 +1683,7 @@ def _current_picture_payload_unlocked() -> dict[str, Any]:
             "content_type": None,
             "updated_at": int(state.last_switch_at),
             "url": None,
+            **{field: None for field in PICTURE_METADATA_FIELDS},
         }
 
     return {
@@ -505,230 +1692,1029 @@ def _current_picture_payload_unlocked() -> dict[str, Any]:
         "filename": image.original_filename,
         "content_type": image.content_type,
         "updated_at": int(state.last_switch_at),
-        "url": _picture_url(image.picture_id),
+        "url": _display_url(image.picture_id),
+        **image.model_dump(include=PICTURE_METADATA_FIELDS),
     }
 
 
-def _playlist_payload_unlocked() -> dict[str, Any]:
-    state = _require_playlist_state()
+def _playlist_payload(state: PlaylistState, images: Iterable[PictureEntry] | None = None) -> dict[str, Any]:
+    return {
+        "version": state.version,
+        "delta": False,
+        "images": [_image_payload(image) for image in (state.images if images is None else images)],
+        "current_picture_id": state.current_picture_id,
+        "interval_seconds": state.interval_seconds,
+        "empty": len(state.images) == 0,
+        "storage": _storage_payload(),
+    }
+
+
+def _playlist_delta_payload(state: PlaylistState, since: int) -> dict[str, Any] | None:
+    """What changed after version `since`; None once the changelog no longer reaches back that far."""
+    if not state.changelog_since <= since <= state.version:
+        return None
+    added: set[str] = set()
+    changed: set[str] = set()
+    removed: set[str] = set()
+    for change in reversed(state.changelog):
+        if change.version <= since:
+            break
+        added |= change.added
+        changed |= change.changed
+        removed |= change.removed
+
+    def entries(ids: set[str]) -> list[dict[str, Any]]:
+        found = (state.images.get(picture_id) for picture_id in ids)
+        return [_image_payload(image) for image in sorted(filter(None, found), key=lambda i: i.sort_key)]
+
+    # Ids are never reused, so anything added after `since` was unknown to the client.
     return {
-        "images": [_image_payload(image) for image in state.images],
+        "version": state.version,
+        "delta": True,
+        "since": since,
+        "added": entries(added),
+        "changed": entries(changed - added),
+        "removed": sorted(removed - added),
         "current_picture_id": state.current_picture_id,
         "interval_seconds": state.interval_seconds,
         "empty": len(state.images) == 0,
+        "storage": _storage_payload(),
+    }
+
+
+def _upcoming_payload(state: PlaylistState, count: int = PREFETCH_COUNT) -> dict[str, Any]:
+    """The next pictures in play order, each with the time it is due on screen."""
+    total = len(state.images)
+    current_idx = state.images.position(state.current_picture_id) or 0
+    upcoming = []
+    for step in range(1, min(count, total - 1) + 1):
+        image = state.images.at((current_idx + step) % total)
+        upcoming.append(
+            {
+                "picture_id": image.picture_id,
+                "url": _display_url(image.picture_id),
+                "switch_at": state.last_switch_at + step * state.interval_seconds,
+            }
+        )
+    return {
+        "current_picture_id": state.current_picture_id,
+        "interval_seconds": state.interval_seconds,
+        "upcoming": upcoming,
     }
 
 
+def _picture_meta_json(state: PlaylistState) -> bytes:
+    return _cached_json("picture", state.version, lambda: _current_picture_payload(state))
+
+
+def _upcoming_json(state: PlaylistState, count: int = PREFETCH_COUNT) -> bytes:
+    return _cached_json(f"upcoming:{count}", state.version, lambda: _upcoming_payload(state, count))
+
+
+def _send_prefetch():
+    """Lets the kiosk preload what comes next; call after any order or timing change."""
+    sse_send_json("prefetch", _upcoming_json(_require_playlist_state()))
+
+
+def _announce_removal(previous: PlaylistState, state: PlaylistState):
+    """Tells the kiosk that pictures left the playlist between the two snapshots."""
+    _rearm_slideshow()
+    if state.current_picture_id != previous.current_picture_id:
+        sse_send_json("picture", _picture_meta_json(state))
+    _send_prefetch()
+
+
 def _touch_slideshow_clock():
     with _playlist_lock:
-        state = _require_playlist_state()
-        state.last_switch_at = time.time()
-        _persist_playlist_unlocked()
+        _publish_unlocked(_require_playlist_state(), last_switch_at=time.time())
+    _rearm_slideshow()
+    _send_prefetch()
+
+
+def _rearm_slideshow():
+    """Makes the slideshow worker recompute its deadline; safe from any thread."""
+    loop, wakeup = _app_loop, _slideshow_wakeup
+    if loop is None or wakeup is None or loop.is_closed():
+        return
+    loop.call_soon_threadsafe(wakeup.set)
 
 
-def _advance_picture_unlocked() -> dict[str, Any] | None:
+def _next_switch_deadline() -> float | None:
+    """Wall-clock time of the next switch, or None while the slideshow is suspended."""
+    if _call_blocks_slideshow():
+        return None
     state = _require_playlist_state()
     if len(state.images) < 2:
         return None
+    return state.last_switch_at + state.interval_seconds
 
-    current_idx = 0
-    if state.current_picture_id:
-        for idx, image in enumerate(state.images):
-            if image.picture_id == state.current_picture_id:
-                current_idx = idx
-                break
 
+def _advance_picture_unlocked() -> PlaylistState | None:
+    state = _require_playlist_state()
+    if len(state.images) < 2:
+        return None
+
+    current_idx = state.images.position(state.current_picture_id) or 0
     next_idx = (current_idx + 1) % len(state.images)
-    state.current_picture_id = state.images[next_idx].picture_id
-    state.last_switch_at = time.time()
-    _persist_playlist_unlocked()
-    return _current_picture_payload_unlocked()
+    return _publish_unlocked(
+        state,
+        current_picture_id=state.images.at(next_idx).picture_id,
+        last_switch_at=time.time(),
+    )
+
+
+def _rendition_filenames(filename: str) -> tuple[str, str]:
+    stem = Path(filename).stem
+    return f"renditions/{stem}.thumb.jpg", f"renditions/{stem}.display.jpg"
+
+
+def _save_jpeg(image: Image.Image, dst: Path):
+    tmp = dst.with_name(f".{dst.name}.tmp")
+    image.save(tmp, "JPEG", quality=RENDITION_QUALITY, optimize=True, progressive=True)
+    tmp.replace(dst)
+
+
+def _new_cpu_pool() -> ProcessPoolExecutor:
+    # forkserver: forking the already threaded server process is unsafe.
+    return ProcessPoolExecutor(
+        max_workers=CPU_WORKERS, mp_context=multiprocessing.get_context("forkserver")
+    )
+
+
+async def _run_cpu(func, *args):
+    """Runs image work in the process pool; `func` must be a module-level function."""
+    global _cpu_pool
+    if _cpu_pool is None:
+        return await asyncio.to_thread(func, *args)
+    pool = _cpu_pool
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for memory on a huge image); later jobs
+        # get a fresh pool instead of failing forever.
+        if _cpu_pool is pool:
+            _cpu_pool = _new_cpu_pool()
+        raise
+
+
+def _ingest_picture(
+    src: Path, dst: Path, fmt: str, frame_size: tuple[int, int], quality: int
+) -> str:
+    """Writes `src` to `dst` as the frame shows it and returns its content type."""
+    with Image.open(src) as raw:
+        # Both sides must still cover the frame after a possible 90° turn.
+        side = max(frame_size)
+        raw.draft("RGB", (side, side))
+        image = ImageOps.exif_transpose(raw)
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+        mode = "RGBA" if fmt == "webp" and has_alpha else "RGB"
+        if image.mode != mode:
+            image = image.convert(mode)
+        icc_profile = raw.info.get("icc_profile")
+
+    # The kiosk crops to fill the panel, so keep enough pixels to cover it
+    # rather than fit inside it.
+    scale = max(frame_size[0] / image.width, frame_size[1] / image.height)
+    if scale < 1:
+        size = (round(image.width * scale), round(image.height * scale))
+        image = image.resize(size, Image.Resampling.LANCZOS)
+
+    # No exif= is passed, which drops EXIF/GPS; the colour profile is kept.
+    if fmt == "webp":
+        image.save(dst, "WEBP", quality=quality, method=4, icc_profile=icc_profile)
+        return "image/webp"
+    # Baseline decodes faster than progressive, and the bytes only ever
+    # travel over localhost to the kiosk browser.
+    image.save(dst, "JPEG", quality=quality, optimize=True, icc_profile=icc_profile)
+    return "image/jpeg"
+
+
+def _render_derivatives(src: Path, thumb_dst: Path, display_dst: Path):
+    with Image.open(src) as raw:
+        # Lets the JPEG decoder scale by 1/2..1/8 while decoding instead of
+        # materializing the full 12 MP frame; square, as EXIF may turn it 90°.
+        side = max(DISPLAY_SIZE)
+        raw.draft("RGB", (side, side))
+        image = ImageOps.exif_transpose(raw)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+    # The kiosk shows /display with object-fit: cover, so it has to cover the
+    # panel, like _ingest_picture, or the browser would upscale it.
+    scale = max(DISPLAY_SIZE[0] / image.width, DISPLAY_SIZE[1] / image.height)
+    if scale < 1:
+        size = (round(image.width * scale), round(image.height * scale))
+        image = image.resize(size, Image.Resampling.LANCZOS)
+    _save_jpeg(image, display_dst)
+    image.thumbnail(THUMB_SIZE, Image.Resampling.LANCZOS)
+    _save_jpeg(image, thumb_dst)
+
+
+def _picture_metadata(path: Path) -> dict[str, Any]:
+    with Image.open(path) as raw:
+        orientation = raw.getexif().get(ExifTags.Base.Orientation, 1)
+        width, height = raw.size
+        if orientation in (5, 6, 7, 8):
+            width, height = height, width
+        raw.draft("RGB", METADATA_DRAFT_SIZE)
+        image = ImageOps.exif_transpose(raw)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image.thumbnail(METADATA_DRAFT_SIZE)
+
+    # Most populated bucket of a small palette, so a mostly-blue sky with a
+    # red boat reads as blue rather than the muddy average of both.
+    palette = image.quantize(colors=8)
+    _, index = max(palette.getcolors())
+    r, g, b = palette.getpalette()[index * 3 : index * 3 + 3]
+
+    image.thumbnail(PLACEHOLDER_SIZE, Image.Resampling.LANCZOS)
+    buf = io.BytesIO()
+    image.save(buf, "JPEG", quality=PLACEHOLDER_QUALITY, optimize=True)
+    return {
+        "width": width,
+        "height": height,
+        "orientation": orientation,
+        "dominant_color": f"#{r:02x}{g:02x}{b:02x}",
+        "placeholder": "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode("ascii"),
+    }
+
+
+def _missing_derivatives(image: PictureEntry) -> bool:
+    return (
+        not (image.thumb_filename and image.display_filename)
+        or image.width is None
+        or image.size_bytes is None
+    )
+
+
+def _enqueue_renditions(picture_id: str):
+    if _rendition_queue is not None:
+        _rendition_queue.put_nowait(picture_id)
+
+
+async def _rendition_worker():
+    assert _rendition_queue is not None
+    while True:
+        picture_id = await _rendition_queue.get()
+        image = _require_playlist_state().images.get(picture_id)
+        if image is None or not _missing_derivatives(image):
+            continue
+        filename = image.filename
+        needs_metadata = image.width is None
+        thumb_name, display_name = _rendition_filenames(filename)
+
+        thumb_path = PICTURE_DIR / thumb_name
+        display_path = PICTURE_DIR / display_name
+        if not (PICTURE_DIR / filename).is_file():
+            # Left for the integrity scan to prune.
+            continue
+        if not (thumb_path.is_file() and display_path.is_file()):
+            try:
+                await _run_cpu(_render_derivatives, PICTURE_DIR / filename, thumb_path, display_path)
+            except Exception:
+                log.exception("Could not render derivatives for %s", picture_id)
+                continue
+
+        # Pictures from before metadata existed are filled in here.
+        metadata: dict[str, Any] = {}
+        if needs_metadata:
+            try:
+                metadata = await _run_cpu(_picture_metadata, PICTURE_DIR / filename)
+            except Exception:
+                log.exception("Could not read metadata for %s", picture_id)
+
+        # Renditions count against the storage budget once they exist.
+        rendered = image.model_copy(update={"thumb_filename": thumb_name, "display_filename": display_name})
+        size_bytes = await asyncio.to_thread(_stored_bytes, rendered)
+
+        with _playlist_lock:
+            state = _require_playlist_state()
+            image = state.images.get(picture_id)
+            if image is not None:
+                image = image.model_copy(
+                    update={
+                        "thumb_filename": thumb_name,
+                        "display_filename": display_name,
+                        "size_bytes": size_bytes,
+                        **metadata,
+                    }
+                )
+                _account_blob_unlocked(filename, size_bytes)
+                images = state.images.copy()
+                images.replace(image)
+                state = _publish_unlocked(state, changed=[picture_id], images=images)
+                persisted = _persist_pictures_unlocked(state, image)
+
+        if image is None:
+            # Deleted while rendering.
+            await asyncio.to_thread(_unlink_unreferenced, filename, (thumb_path, display_path))
+            continue
+        try:
+            await asyncio.wrap_future(persisted)
+        except Exception:
+            log.exception("Could not save renditions for %s", picture_id)
+        # The upload only reserved its blob; evict again if the renditions
+        # pushed the library over the budget.
+        if not await asyncio.to_thread(_make_room, 0, spare=picture_id):
+            log.warning("Renditions of %s leave the library over its storage budget", picture_id)
+
+
+# Files the scan may collect; anything else in PICTURE_DIR is left alone.
+BLOB_SUFFIXES = set(ALLOWED.values())
+QUARANTINED_KINDS = {"picture", "original", "legacy"}
+
+
+def _batched(items: list[Any], size: int = INTEGRITY_SCAN_BATCH) -> Iterator[list[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _blob_key(name: str) -> str:
+    # Renditions and kept originals are named after their blob's stem.
+    return name.split(".", 1)[0]
+
+
+def _check_entries(images: list[PictureEntry]) -> tuple[list[str], list[str]]:
+    """Ids whose blob is gone and ids missing a rendition file; runs in a worker thread."""
+    missing = []
+    stale = []
+    for image in images:
+        if not (PICTURE_DIR / image.filename).is_file():
+            missing.append(image.picture_id)
+        elif _lost_renditions(image):
+            stale.append(image.picture_id)
+    return missing, stale
+
+
+def _lost_renditions(image: PictureEntry) -> bool:
+    names = (image.thumb_filename, image.display_filename)
+    return any(name and not (PICTURE_DIR / name).is_file() for name in names)
+
+
+def _drop_missing_picture(picture_id: str) -> bool:
+    """Removes an entry whose blob is gone from disk; runs in a worker thread."""
+    with _playlist_lock:
+        previous = _require_playlist_state()
+        image = previous.images.get(picture_id)
+        if image is None or (PICTURE_DIR / image.filename).is_file():
+            return False
+        state, image, last_reference, persisted = _remove_picture_unlocked(previous, picture_id)
+
+    persisted.result()
+    if last_reference:
+        _unlink_unreferenced(image.filename, _blob_paths(image))
+    _announce_removal(previous, state)
+    return True
+
+
+def _forget_renditions(picture_id: str) -> bool:
+    """Clears rendition names whose files are gone so they get rendered again; runs in a worker thread."""
+    with _playlist_lock:
+        state = _require_playlist_state()
+        image = state.images.get(picture_id)
+        if image is None or not _lost_renditions(image):
+            return False
+        image = image.model_copy(update={"thumb_filename": None, "display_filename": None})
+        images = state.images.copy()
+        images.replace(image)
+        state = _publish_unlocked(state, changed=[picture_id], images=images)
+        persisted = _persist_pictures_unlocked(state, image)
+
+    persisted.result()
+    return True
+
+
+def _list_files(directory: Path) -> list[Path]:
+    try:
+        with os.scandir(directory) as entries:
+            return [Path(entry.path) for entry in entries if entry.is_file(follow_symlinks=False)]
+    except FileNotFoundError:
+        return []
+
+
+def _orphan_kind(path: Path, stems: set[str]) -> str | None:
+    """What kind of garbage `path` is, or None if it is in use or not ours to touch."""
+    name = path.name
+    if name.startswith(".upload_") or name.endswith(".tmp"):
+        return "temp"
+    key = _blob_key(name)
+    if path.parent == RENDITION_DIR:
+        return None if key in stems else "rendition"
+    if path.parent == ORIGINALS_DIR:
+        return None if key in stems else "original"
+    if key == "current":
+        # Left behind by the single-picture layout, after migration.
+        return "legacy"
+    if path.suffix.lower() in BLOB_SUFFIXES:
+        return None if key in stems else "picture"
+    return None
+
+
+def _referenced_stems_unlocked() -> set[str]:
+    return {_blob_key(name) for name in _blob_refs}
+
+
+def _collect_orphans(paths: list[Path], stems: set[str]) -> list[dict[str, Any]]:
+    """Deletes or quarantines the unreferenced files among `paths`; runs in a worker thread."""
+    now = time.time()
+    candidates = []
+    for path in paths:
+        kind = _orphan_kind(path, stems)
+        if kind is None:
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        if now - stat.st_mtime >= ORPHAN_GRACE_SECONDS:
+            candidates.append((path, kind, stat.st_size))
+    if not candidates:
+        return []
+
+    collected = []
+    # Nothing gains a reference while _blob_lock is held, see _commit_blob().
+    with _blob_lock:
+        with _playlist_lock:
+            stems = _referenced_stems_unlocked()
+        for path, kind, size in candidates:
+            if _orphan_kind(path, stems) is None:
+                continue
+            relative = path.relative_to(PICTURE_DIR)
+            try:
+                if kind in QUARANTINED_KINDS and ORPHAN_ACTION == "quarantine":
+                    target = QUARANTINE_DIR / relative
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    path.replace(target)
+                    action = "quarantined"
+                else:
+                    path.unlink()
+                    action = "deleted"
+            except FileNotFoundError:
+                continue
+            collected.append({"path": str(relative), "kind": kind, "bytes": size, "action": action})
+    return collected
+
+
+def _purge_quarantine() -> int:
+    """Deletes quarantined files past their retention; returns the bytes freed."""
+    cutoff = time.time() - QUARANTINE_RETENTION_SECONDS
+    freed = 0
+    for root, _, names in os.walk(QUARANTINE_DIR):
+        for name in names:
+            path = Path(root) / name
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            # Moving a file into quarantine updates its ctime, not its mtime.
+            if stat.st_ctime < cutoff:
+                path.unlink(missing_ok=True)
+                freed += stat.st_size
+    return freed
+
+
+async def _integrity_scan() -> dict[str, Any]:
+    """One pass over the playlist and PICTURE_DIR, a batch at a time."""
+    scan: dict[str, Any] = {
+        "started_at": time.time(),
+        "finished_at": None,
+        "entries_checked": 0,
+        "missing_pictures": [],
+        "stale_renditions": [],
+        "files_checked": 0,
+        "orphan_count": 0,
+        "orphans": [],
+        "bytes_reclaimed": 0,
+    }
+
+    for batch in _batched(list(_require_playlist_state().images)):
+        missing, stale = await asyncio.to_thread(_check_entries, batch)
+        scan["entries_checked"] += len(batch)
+        for picture_id in missing:
+            if await asyncio.to_thread(_drop_missing_picture, picture_id):
+                log.warning("Removed picture %s, its file is gone", picture_id)
+                scan["missing_pictures"].append(picture_id)
+        for picture_id in stale:
+            if await asyncio.to_thread(_forget_renditions, picture_id):
+                scan["stale_renditions"].append(picture_id)
+                _enqueue_renditions(picture_id)
+        await asyncio.sleep(INTEGRITY_SCAN_PAUSE_SECONDS)
+
+    with _playlist_lock:
+        stems = _referenced_stems_unlocked()
+    paths = []
+    for directory in (PICTURE_DIR, RENDITION_DIR, ORIGINALS_DIR):
+        paths.extend(await asyncio.to_thread(_list_files, directory))
+    for batch in _batched(paths):
+        for orphan in await asyncio.to_thread(_collect_orphans, batch, stems):
+            log.info("Orphaned %s %s: %s", orphan["kind"], orphan["path"], orphan["action"])
+            scan["orphan_count"] += 1
+            scan["bytes_reclaimed"] += orphan["bytes"]
+            if len(scan["orphans"]) < INTEGRITY_REPORT_MAX_FILES:
+                scan["orphans"].append(orphan)
+        scan["files_checked"] += len(batch)
+        await asyncio.sleep(INTEGRITY_SCAN_PAUSE_SECONDS)
+
+    scan["bytes_reclaimed"] += await asyncio.to_thread(_purge_quarantine)
+    scan["finished_at"] = time.time()
+    return scan
+
+
+async def _integrity_worker():
+    global _integrity_running, _integrity_last
+    assert _integrity_wakeup is not None
+    # The first pass waits until the kiosk is up and showing pictures.
+    delay: float | None = INTEGRITY_SCAN_DELAY_SECONDS
+    while True:
+        if INTEGRITY_SCAN_SECONDS <= 0:
+            delay = None
+        try:
+            await asyncio.wait_for(_integrity_wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        _integrity_wakeup.clear()
+        _integrity_running = True
+        try:
+            _integrity_last = await _integrity_scan()
+        except Exception:
+            log.exception("Integrity scan failed")
+        finally:
+            _integrity_running = False
+        delay = INTEGRITY_SCAN_SECONDS
 
 
 async def _slideshow_worker():
+    assert _slideshow_wakeup is not None
     while True:
-        await asyncio.sleep(1)
-        if _call_blocks_slideshow():
+        _slideshow_wakeup.clear()
+        deadline = _next_switch_deadline()
+        if deadline is None:
+            await _slideshow_wakeup.wait()
             continue
+        delay = deadline - time.time()
+        if delay > 0:
+            try:
+                await asyncio.wait_for(_slideshow_wakeup.wait(), timeout=delay)
+                continue
+            except asyncio.TimeoutError:
+                pass
 
-        snapshot: dict[str, Any] | None = None
+        if _call_blocks_slideshow():
+            continue
         with _playlist_lock:
             state = _require_playlist_state()
             if len(state.images) < 2:
                 continue
             if time.time() - state.last_switch_at < state.interval_seconds:
                 continue
-            snapshot = _advance_picture_unlocked()
+            advanced = _advance_picture_unlocked()
 
-        if snapshot is not None:
-            sse_send("picture", snapshot)
+        if advanced is not None:
+            sse_send_json("picture", _picture_meta_json(advanced))
+            sse_send_json("prefetch", _upcoming_json(advanced))
 
 
 @app.on_event("startup")
 async def startup():
-    global _slideshow_task
+    global _slideshow_task, _rendition_queue, _rendition_task, _volatile_flush_task
+    global _slideshow_wakeup, _app_loop, _volume_wakeup, _volume_task, _cpu_pool
+    global _integrity_task, _integrity_wakeup
+    _app_loop = asyncio.get_running_loop()
+    _audio.start()
+    _volume_wakeup = asyncio.Event()
+    _volume_task = asyncio.create_task(_volume_worker())
+    _slideshow_wakeup = asyncio.Event()
+    _rendition_queue = asyncio.Queue()
+    if CPU_WORKERS > 0:
+        _cpu_pool = _new_cpu_pool()
     with _playlist_lock:
-        _load_playlist_state()
+        state = _load_playlist_state()
+    for image in state.images:
+        if _missing_derivatives(image):
+            _enqueue_renditions(image.picture_id)
     _slideshow_task = asyncio.create_task(_slideshow_worker())
+    _rendition_task = asyncio.create_task(_rendition_worker())
+    _volatile_flush_task = asyncio.create_task(_volatile_flush_worker())
+    _integrity_wakeup = asyncio.Event()
+    _integrity_task = asyncio.create_task(_integrity_worker())
 
 
 @app.on_event("shutdown")
 async def shutdown():
-    global _slideshow_task
-    if _slideshow_task is None:
-        return
-    _slideshow_task.cancel()
-    try:
-        await _slideshow_task
-    except asyncio.CancelledError:
-        pass
+    global _slideshow_task, _rendition_task, _volatile_flush_task, _volume_task, _cpu_pool
+    global _integrity_task
+    for task in (_slideshow_task, _rendition_task, _volatile_flush_task, _volume_task, _integrity_task):
+        if task is None:
+            continue
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
     _slideshow_task = None
+    _rendition_task = None
+    _volatile_flush_task = None
+    _volume_task = None
+    _integrity_task = None
+    _audio.stop()
+    if _cpu_pool is not None:
+        _cpu_pool.shutdown(cancel_futures=True)
+        _cpu_pool = None
+    _flush_volatile()
+    _drain_persistence()
+    _close_db()
 
 
 @api.post("/picture", status_code=201)
-async def upload_picture(file: UploadFile = File(...)):
-    content_type = file.content_type or ""
-    ext = ALLOWED.get(content_type)
-    if not ext:
-        raise HTTPException(415, "Unsupported image type")
-
-    picture_id = uuid.uuid4().hex
-    stored_filename = f"{picture_id}{ext}"
-    tmp = PICTURE_DIR / f".upload_{uuid.uuid4().hex}{ext}"
-    dst = PICTURE_DIR / stored_filename
-    original_filename = _sanitize_original_filename(file.filename, ext)
-    uploaded_at = int(time.time())
+async def upload_picture(response: Response, file: UploadFile = File(...)):
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        await file.close()
+        raise HTTPException(413, "Upload too large")
 
+    tmp: Path | None = None
+    original: Path | None = None
+    reserved = 0
     try:
-        with tmp.open("wb") as out:
-            shutil.copyfileobj(file.file, out)
-        tmp.replace(dst)
+        tmp, content_type, sha256 = await asyncio.to_thread(_receive_upload, file.file)
+        ext = ALLOWED[content_type]
+        picture_id = uuid.uuid4().hex
+        stored_filename = f"{sha256}{ext}"
+        original_filename = _sanitize_original_filename(file.filename, ext)
+        uploaded_at = int(time.time())
+
+        state = _require_playlist_state()
+        existing = state.images.find_sha256(sha256)
+        if existing is not None and DUPLICATE_UPLOADS != "reference":
+            response.status_code = 200
+            return {
+                "ok": True,
+                "duplicate": True,
+                "picture": _image_payload(existing),
+                "current_picture_id": state.current_picture_id,
+            }
+
+        metadata: dict[str, Any] = {}
+        if existing is None:
+            try:
+                if INGEST_FORMAT != "off":
+                    # Done before the blob is committed, so the bytes behind
+                    # a picture id never change once it is visible.
+                    ingested = tmp.with_name(f"{tmp.name}.ingest")
+                    try:
+                        content_type = await _run_cpu(
+                            _ingest_picture, tmp, ingested, INGEST_FORMAT, FRAME_SIZE, INGEST_QUALITY
+                        )
+                    except BaseException:
+                        ingested.unlink(missing_ok=True)
+                        raise
+                    original, tmp = tmp, ingested
+                    stored_filename = f"{sha256}{ALLOWED[content_type]}"
+                metadata = await _run_cpu(_picture_metadata, tmp)
+            except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+                # PIL's own OSErrors (UnidentifiedImageError, truncated data)
+                # carry no errno; ENOSPC, EIO and friends are ours to report.
+                if isinstance(e, OSError) and e.errno is not None:
+                    raise
+                raise HTTPException(415, "Unreadable image")
+
+            size_bytes = tmp.stat().st_size
+            if original is not None and KEEP_ORIGINALS:
+                size_bytes += original.stat().st_size
+            # Room is made before anything is committed, evicting if need be.
+            await asyncio.to_thread(_reserve_storage, size_bytes)
+            reserved = size_bytes
+            if original is not None:
+                if KEEP_ORIGINALS:
+                    ORIGINALS_DIR.mkdir(exist_ok=True)
+                    await asyncio.to_thread(
+                        _commit_upload, original, ORIGINALS_DIR / f"{sha256}{ext}"
+                    )
+                else:
+                    original.unlink()
+            await asyncio.to_thread(_commit_blob, tmp, stored_filename, size_bytes)
+            metadata["size_bytes"] = size_bytes
 
-        snapshot_to_send: dict[str, Any] | None = None
         with _playlist_lock:
             state = _require_playlist_state()
-            image = PictureEntry(
-                picture_id=picture_id,
-                filename=stored_filename,
-                original_filename=original_filename,
-                content_type=content_type,
-                uploaded_at=uploaded_at,
+            if existing is not None:
+                # Looked up again so the blob cannot vanish before it is referenced.
+                existing = state.images.find_sha256(sha256)
+                if existing is None:
+                    raise HTTPException(409, "Picture was deleted during upload, try again")
+                # The blob may have been re-encoded at ingest.
+                stored_filename = existing.filename
+                content_type = existing.content_type
+                metadata = existing.model_dump(
+                    include={"thumb_filename", "display_filename", "size_bytes", *PICTURE_METADATA_FIELDS}
+                )
+                _blob_refs[stored_filename] = _blob_refs.get(stored_filename, 0) + 1
+
+            images = state.images.copy()
+            image = images.append(
+                PictureEntry(
+                    picture_id=picture_id,
+                    filename=stored_filename,
+                    original_filename=original_filename,
+                    content_type=content_type,
+                    uploaded_at=uploaded_at,
+                    sha256=sha256,
+                    **metadata,
+                )
             )
-            state.images.append(image)
+            changes: dict[str, Any] = {"images": images}
             if not state.current_picture_id:
-                state.current_picture_id = image.picture_id
-                state.last_switch_at = time.time()
-                snapshot_to_send = _current_picture_payload_unlocked()
-            _persist_playlist_unlocked()
-            payload = _image_payload(image)
-            current_picture_id = state.current_picture_id
-
-        if snapshot_to_send is not None:
-            sse_send("picture", snapshot_to_send)
+                changes["current_picture_id"] = image.picture_id
+                changes["last_switch_at"] = time.time()
+            state = _publish_unlocked(state, added=[image.picture_id], **changes)
+            persisted = _persist_pictures_unlocked(state, image)
+
+        await asyncio.wrap_future(persisted)
+        _enqueue_renditions(picture_id)
+        _rearm_slideshow()
+        if "current_picture_id" in changes:
+            sse_send_json("picture", _picture_meta_json(state))
+        _send_prefetch()
 
         return {
             "ok": True,
-            "picture": payload,
-            "current_picture_id": current_picture_id,
+            "duplicate": existing is not None,
+            "picture": _image_payload(image),
+            "current_picture_id": state.current_picture_id,
         }
     finally:
         await file.close()
-        if tmp.exists():
-            tmp.unlink(missing_ok=True)
+        for leftover in (tmp, original):
+            if leftover is not None and leftover.exists():
+                leftover.unlink(missing_ok=True)
+        if reserved:
+            _release_storage(reserved)
 
 
 @api.get("/pictures")
-def list_pictures():
-    with _playlist_lock:
-        return _playlist_payload_unlocked()
+def list_pictures(
+    request: Request,
+    since: int | None = None,
+    cursor: float | None = None,
+    limit: int | None = None,
+):
+    """The playlist; `since` asks for a delta, `cursor`/`limit` for one page."""
+    state = _require_playlist_state()
+    headers = {"ETag": f'"{state.version}"', "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    if since is not None:
+        payload = _playlist_delta_payload(state, since) or _playlist_payload(state)
+    elif cursor is not None or limit is not None:
+        limit = PLAYLIST_PAGE_MAX if limit is None else limit
+        if not 1 <= limit <= PLAYLIST_PAGE_MAX:
+            raise HTTPException(400, f"limit must be between 1 and {PLAYLIST_PAGE_MAX}")
+        images, more = state.images.page(cursor, limit)
+        payload = _playlist_payload(state, images)
+        payload["next_cursor"] = images[-1].sort_key if more else None
+    else:
+        # The full listing is what remote polls fetch; render it once per version.
+        body = _cached_json("pictures", state.version, lambda: _playlist_payload(state))
+        return _json_response(body, headers)
+    return JSONResponse(payload, headers=headers)
+
+
+def _stat_etag(stat: os.stat_result) -> str:
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    if request.headers.get("if-none-match") is not None:
+        # If-None-Match wins over If-Modified-Since (RFC 9110 13.2.2).
+        return _etag_matches(request, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _cached_file_response(
+    request: Request,
+    path: Path,
+    *,
+    media_type: str | None = None,
+    cache_control: str,
+    etag: str | None = None,
+    headers: dict[str, str] | None = None,
+    missing_detail: str = "Not found",
+) -> Response:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise HTTPException(404, missing_detail)
+    etag = etag or _stat_etag(stat)
+    headers = {
+        **(headers or {}),
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Cache-Control": cache_control,
+    }
+    if _not_modified(request, etag, stat.st_mtime):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat)
+
+
+def _original_response(request: Request, image: PictureEntry, cache_control: str) -> Response:
+    return _cached_file_response(
+        request,
+        PICTURE_DIR / image.filename,
+        media_type=image.content_type,
+        cache_control=cache_control,
+        etag=f'"{image.sha256}"' if image.sha256 else None,
+        missing_detail="Picture file missing",
+    )
 
 
 @api.get("/pictures/{picture_id}/file")
-def get_picture_by_id(picture_id: str):
-    with _playlist_lock:
-        state = _require_playlist_state()
-        for image in state.images:
-            if image.picture_id == picture_id:
-                path = PICTURE_DIR / image.filename
-                if not path.is_file():
-                    raise HTTPException(404, "Picture file missing")
-                return FileResponse(path, media_type=image.content_type)
-    raise HTTPException(404, "Unknown picture_id")
+def get_picture_by_id(picture_id: str, request: Request):
+    image = _require_playlist_state().images.get(picture_id)
+    if image is None:
+        raise HTTPException(404, "Unknown picture_id")
+    return _original_response(request, image, IMMUTABLE_CACHE_CONTROL)
+
+
+def _rendition_response(
+    request: Request,
+    image: PictureEntry,
+    rendition: str | None,
+    *,
+    cache_control: str = IMMUTABLE_CACHE_CONTROL,
+) -> Response:
+    if rendition and (PICTURE_DIR / rendition).is_file():
+        return _cached_file_response(
+            request,
+            PICTURE_DIR / rendition,
+            media_type="image/jpeg",
+            cache_control=cache_control,
+            etag=f'"{Path(rendition).name.removesuffix(".jpg")}"',
+        )
+    # Until the worker has caught up the original is served instead, and
+    # must not be cached under the rendition's URL for good.
+    return _original_response(request, image, REVALIDATE_CACHE_CONTROL)
+
+
+@api.get("/pictures/{picture_id}/thumb")
+def get_picture_thumb(picture_id: str, request: Request):
+    image = _require_playlist_state().images.get(picture_id)
+    if image is None:
+        raise HTTPException(404, "Unknown picture_id")
+    return _rendition_response(request, image, image.thumb_filename)
+
+
+@api.get("/pictures/{picture_id}/display")
+def get_picture_display(picture_id: str, request: Request):
+    image = _require_playlist_state().images.get(picture_id)
+    if image is None:
+        raise HTTPException(404, "Unknown picture_id")
+    return _rendition_response(request, image, image.display_filename)
 
 
 @api.delete("/pictures/{picture_id}")
 def delete_picture(picture_id: str):
-    snapshot_to_send: dict[str, Any] | None = None
+    with _playlist_lock:
+        previous = _require_playlist_state()
+        if picture_id not in previous.images:
+            raise HTTPException(404, "Unknown picture_id")
+        state, image, last_reference, persisted = _remove_picture_unlocked(previous, picture_id)
+
+    persisted.result()
+    if last_reference:
+        _unlink_unreferenced(image.filename, _blob_paths(image))
+    _announce_removal(previous, state)
+    return {
+        "ok": True,
+        "deleted_picture_id": picture_id,
+        "current_picture_id": state.current_picture_id,
+        "empty": len(state.images) == 0,
+    }
+
+
+@api.put("/pictures/{picture_id}/position")
+def move_picture(picture_id: str, body: PictureMoveIn):
     with _playlist_lock:
         state = _require_playlist_state()
-        idx = next((i for i, image in enumerate(state.images) if image.picture_id == picture_id), None)
-        if idx is None:
+        if picture_id not in state.images:
             raise HTTPException(404, "Unknown picture_id")
+        if body.before_picture_id is not None and body.before_picture_id not in state.images:
+            raise HTTPException(404, "Unknown before_picture_id")
+        images = state.images.copy()
+        changed = images.move(picture_id, body.before_picture_id)
+        if changed:
+            state = _publish_unlocked(
+                state, changed=[image.picture_id for image in changed], images=images
+            )
+            persisted = _persist_pictures_unlocked(state, *changed)
 
-        was_current = state.current_picture_id == picture_id
-        image = state.images.pop(idx)
-        (PICTURE_DIR / image.filename).unlink(missing_ok=True)
-
-        if not state.images:
-            state.current_picture_id = None
-            state.last_switch_at = time.time()
-            snapshot_to_send = _current_picture_payload_unlocked()
-        elif was_current:
-            next_idx = idx if idx < len(state.images) else 0
-            state.current_picture_id = state.images[next_idx].picture_id
-            state.last_switch_at = time.time()
-            snapshot_to_send = _current_picture_payload_unlocked()
-        elif state.current_picture_id not in {entry.picture_id for entry in state.images}:
-            state.current_picture_id = state.images[0].picture_id
-            state.last_switch_at = time.time()
-            snapshot_to_send = _current_picture_payload_unlocked()
-
-        _persist_playlist_unlocked()
-        response = {
-            "ok": True,
-            "deleted_picture_id": picture_id,
-            "current_picture_id": state.current_picture_id,
-            "empty": len(state.images) == 0,
-        }
+    if changed:
+        persisted.result()
+        _send_prefetch()
+    return {
+        "ok": True,
+        "picture_id": picture_id,
+        "position": state.images.position(picture_id),
+    }
+
+
+@api.put("/pictures/{picture_id}/pinned")
+def pin_picture(picture_id: str, body: PicturePinIn):
+    persisted = None
+    with _playlist_lock:
+        state = _require_playlist_state()
+        image = state.images.get(picture_id)
+        if image is None:
+            raise HTTPException(404, "Unknown picture_id")
+        if image.pinned != body.pinned:
+            image = image.model_copy(update={"pinned": body.pinned})
+            images = state.images.copy()
+            images.replace(image)
+            state = _publish_unlocked(state, changed=[picture_id], images=images)
+            persisted = _persist_pictures_unlocked(state, image)
+
+    if persisted is not None:
+        persisted.result()
+    return {"ok": True, "picture_id": picture_id, "pinned": image.pinned}
+
+
+@api.get("/integrity")
+def get_integrity_report():
+    return {
+        "running": _integrity_running,
+        "interval_seconds": INTEGRITY_SCAN_SECONDS,
+        "grace_seconds": ORPHAN_GRACE_SECONDS,
+        "orphan_action": ORPHAN_ACTION,
+        "last_scan": _integrity_last,
+    }
 
-    if snapshot_to_send is not None:
-        sse_send("picture", snapshot_to_send)
-    return response
+
+@api.post("/integrity/scan", status_code=202)
+async def start_integrity_scan():
+    if _integrity_wakeup is not None:
+        _integrity_wakeup.set()
+    return {"ok": True, "running": _integrity_running}
 
 
 @api.get("/slideshow")
 def get_slideshow_settings():
-    with _playlist_lock:
-        state = _require_playlist_state()
-        return {"interval_seconds": state.interval_seconds}
+    state = _require_playlist_state()
+    return _json_response(
+        _cached_json("slideshow", state.version, lambda: {"interval_seconds": state.interval_seconds})
+    )
 
 
 @api.put("/slideshow")
 def set_slideshow_settings(body: SlideshowIn):
     with _playlist_lock:
-        state = _require_playlist_state()
-        state.interval_seconds = body.interval_seconds
-        state.last_switch_at = time.time()
-        _persist_playlist_unlocked()
-        return {"ok": True, "interval_seconds": state.interval_seconds}
+        state = _publish_unlocked(
+            _require_playlist_state(),
+            interval_seconds=body.interval_seconds,
+            last_switch_at=time.time(),
+        )
+        persisted = _persist_state_unlocked(state)
+
+    persisted.result()
+    _rearm_slideshow()
+    _send_prefetch()
+    return {"ok": True, "interval_seconds": state.interval_seconds}
+
+
+@api.get("/slideshow/upcoming")
+def get_slideshow_upcoming(count: int = PREFETCH_COUNT):
+    if not 1 <= count <= PREFETCH_MAX_COUNT:
+        raise HTTPException(400, f"count must be between 1 and {PREFETCH_MAX_COUNT}")
+    return _json_response(_upcoming_json(_require_playlist_state(), count))
 
 
 @api.get("/picture/meta")
 def get_picture_meta():
-    with _playlist_lock:
-        return _current_picture_payload_unlocked()
+    return _json_response(_picture_meta_json(_require_playlist_state()))
 
 
 @api.get("/picture")
-def get_picture_file():
-    with _playlist_lock:
-        image = _current_entry_unlocked()
-        if image is None:
-            raise HTTPException(404, "No picture set")
-        path = PICTURE_DIR / image.filename
-        if not path.is_file():
-            raise HTTPException(404, "Picture file missing")
-        return FileResponse(path, media_type=image.content_type)
+def get_picture_file(request: Request):
+    # The current picture changes under this URL, so clients revalidate every
+    # time; the per-id /display URL is the one that can be cached for good.
+    image = _current_entry(_require_playlist_state())
+    if image is None:
+        raise HTTPException(404, "No picture set")
+    return _rendition_response(
+        request, image, image.display_filename, cache_control=REVALIDATE_CACHE_CONTROL
+    )
 
 
 app.include_router(api)
@@ -739,24 +2725,134 @@ app.include_router(api)
 #
 
 STATIC_DIR = Path(__file__).parent / "static"
+# Text assets worth shipping precompressed; images are compressed already.
+STATIC_COMPRESSIBLE = {".html", ".js", ".css", ".svg", ".json", ".map", ".txt", ".ico"}
+STATIC_COMPRESS_MIN_BYTES = 1024
+# Content-Encoding and sibling suffix, most preferred first.
+STATIC_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepted_encodings(header: str | None) -> set[str]:
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if coding and q > 0:
+            accepted.add(coding)
+    return accepted
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _precompress_static_assets() -> None:
+    # A Vite build only emits the plain files; the siblings are (re)built here
+    # once so requests never compress on the fly.
+    encodings = [(e, suffix) for e, suffix in STATIC_ENCODINGS if e != "br" or brotli]
+    built = 0
+    for path in STATIC_DIR.rglob("*"):
+        if path.suffix not in STATIC_COMPRESSIBLE or not path.is_file():
+            continue
+        stat = path.stat()
+        if stat.st_size < STATIC_COMPRESS_MIN_BYTES:
+            continue
+        data = None
+        for encoding, suffix in encodings:
+            sibling = path.with_name(path.name + suffix)
+            try:
+                if sibling.stat().st_mtime_ns >= stat.st_mtime_ns:
+                    continue
+            except FileNotFoundError:
+                pass
+            if data is None:
+                data = path.read_bytes()
+            compressed = _compress(data, encoding)
+            if len(compressed) >= len(data):
+                continue
+            tmp = sibling.with_name(sibling.name + ".tmp")
+            try:
+                tmp.write_bytes(compressed)
+                os.replace(tmp, sibling)
+            except OSError as exc:
+                log.warning("Cannot write %s, serving uncompressed: %s", sibling, exc)
+                return
+            built += 1
+    if built:
+        log.info("Precompressed %d static assets", built)
+
+
+def _static_variant(request: Request, path: Path) -> tuple[Path, str | None]:
+    if path.suffix not in STATIC_COMPRESSIBLE:
+        return path, None
+    accepted = _accepted_encodings(request.headers.get("accept-encoding"))
+    for encoding, suffix in STATIC_ENCODINGS:
+        if encoding not in accepted:
+            continue
+        sibling = path.with_name(path.name + suffix)
+        try:
+            # A sibling older than its source is left over from a previous build.
+            if sibling.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+                return sibling, encoding
+        except FileNotFoundError:
+            continue
+    return path, None
+
 
 if STATIC_DIR.exists():
 
+    @app.on_event("startup")
+    async def precompress_static():
+        await asyncio.to_thread(_precompress_static_assets)
+
+
+    def _static_response(request: Request, path: Path) -> Response:
+        # Vite puts a content hash in every file name under assets/.
+        if path.parent == STATIC_DIR / "assets":
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            cache_control = REVALIDATE_CACHE_CONTROL
+        variant, encoding = _static_variant(request, path)
+        headers = {}
+        if path.suffix in STATIC_COMPRESSIBLE:
+            headers["Vary"] = "Accept-Encoding"
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        # Whole files go out untouched, so servers with the pathsend extension
+        # can use sendfile for whichever variant was picked.
+        return _cached_file_response(
+            request,
+            variant,
+            media_type=mimetypes.guess_type(path.name)[0],
+            cache_control=cache_control,
+            headers=headers,
+        )
+
+
     @app.get("/")
-    def spa_root():
-        return FileResponse(STATIC_DIR / "index.html")
+    def spa_root(request: Request):
+        return _static_response(request, STATIC_DIR / "index.html")
 
 
     @app.get("/{path:path}")
-    def spa_fallback(path: str):
+    def spa_fallback(path: str, request: Request):
         if path.startswith("api/"):
             raise HTTPException(status_code=404)
 
         candidate = STATIC_DIR / path
-        if candidate.is_file():
-            return FileResponse(candidate)
+        if candidate.is_file() and candidate.resolve().is_relative_to(STATIC_DIR.resolve()):
+            return _static_response(request, candidate)
 
-        return FileResponse(STATIC_DIR / "index.html")
+        return _static_response(request, STATIC_DIR / "index.html")
 
 else:
 
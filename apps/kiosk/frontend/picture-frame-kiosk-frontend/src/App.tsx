@@ -2,8 +2,9 @@ import { useState, useEffect, useRef } from 'react'
 import { FrameLayout, MediaSurface } from './components/FrameLayout'
 import { VolumeToast, CallIncoming, CallOutgoing } from './components/Overlays'
 import { useKioskEvents } from "./hooks/useKioskEvents";
+import { usePicturePrefetch } from "./hooks/usePicturePrefetch";
 import './App.css'
-import type { CallPayload, PictureSnapshot } from './types/push';
+import type { CallPayload, PictureSnapshot, UpcomingSnapshot } from './types/push';
 
 // each state
 export type Mode = "picture" | "call" | "ended" | "instructions"
@@ -18,9 +19,11 @@ export default function App() {
   const [callMode, setCallMode] = useState<CallMode>(null)
 
   const [photoUrl, setPhotoUrl] = useState<string | null>(null)
+  const [photoPreview, setPhotoPreview] = useState<{ placeholder: string | null; dominantColor: string | null }>({ placeholder: null, dominantColor: null })
   const [pictureEmpty, setPictureEmpty] = useState(true)
   const [volume, setVolume] = useState<number>(40)
   const [showVol, setShowVol] = useState(false)
+  const prefetch = usePicturePrefetch()
 
   //const [callId, setCallId] = useState<string | null>(null);
   //const [callState, setCallState] = useState<CallState>("idle");
@@ -87,10 +90,13 @@ export default function App() {
     }
 
     setPictureEmpty(false);
-    setPhotoUrl(`${snapshot.url}?t=${snapshot.updated_at}`);
+    setPhotoPreview({ placeholder: snapshot.placeholder, dominantColor: snapshot.dominant_color });
+    // Per-picture display URLs never change content, so the browser cache
+    // can serve revisited pictures without a cache-busting query.
+    setPhotoUrl(snapshot.url);
   }
 
-  useEffect(() => {
+  function loadState() {
     fetch(`${API_BASE}/picture/meta`, { cache: "no-store" })
       .then(async (r) => {
         if (!r.ok) throw new Error(`HTTP ${r.status}`);
@@ -102,6 +108,11 @@ export default function App() {
         setPhotoUrl(null);
       });
 
+    fetch(`${API_BASE}/slideshow/upcoming`, { cache: "no-store" })
+      .then((r) => r.json() as Promise<UpcomingSnapshot>)
+      .then((u) => prefetch(u.upcoming))
+      .catch(() => {});
+
     fetch(`${API_BASE}/volume`)
       .then((r) => r.json() as Promise<{ volume_percent: number; muted: boolean }>)
       .then((v) => {
@@ -114,6 +125,10 @@ export default function App() {
       .then((r) => r.json() as Promise<CallPayload>)
       .then((s) => applyCallSnapshot(s))
       .catch(() => {});
+  }
+
+  useEffect(() => {
+    loadState();
   }, []);
 
 
@@ -145,6 +160,10 @@ export default function App() {
         setMode((prev) => (prev === "call" ? prev : "picture"));
       }
 
+      if (msg.event === "prefetch") {
+        prefetch(msg.data.upcoming);
+      }
+
       if (msg.event === "call") {
         // msg.data is the payload you send in push_call()
         applyCallSnapshot(msg.data);
@@ -153,6 +172,11 @@ export default function App() {
       if (msg.event === "reaction") {
         showReaction(msg.data.message);
       }
+
+      if (msg.event === "resync") {
+        // missed more events than the backend keeps for replay
+        loadState();
+      }
     },
   });
 
@@ -165,7 +189,7 @@ export default function App() {
   // })
 
   return (
-    <FrameLayout media={<MediaSurface mode={mode} photoUrl={photoUrl} pictureEmpty={pictureEmpty} />}>
+    <FrameLayout media={<MediaSurface mode={mode} photoUrl={photoUrl} pictureEmpty={pictureEmpty} {...photoPreview} />}>
       {showVol && <VolumeToast value={volume} />}
       {callMode === "callee" && (
         <CallIncoming />
@@ -1,4 +1,4 @@
-import { useEffect, useRef } from "react";
+import { useEffect, useRef, useState } from "react";
 import type { Mode } from "../App";
 
 export function FrameLayout({ media, children }: { media: React.ReactNode; children: React.ReactNode }) {
@@ -14,11 +14,16 @@ export function MediaSurface({
   mode,
   photoUrl,
   pictureEmpty,
+  placeholder,
+  dominantColor,
 }: {
   mode: Mode;
   photoUrl?: string | null;
   pictureEmpty: boolean;
+  placeholder?: string | null;
+  dominantColor?: string | null;
 }) {
+  const [loadedUrl, setLoadedUrl] = useState<string | null>(null)
   const remoteRef = useRef<HTMLVideoElement>(null)
   const localRef  = useRef<HTMLVideoElement>(null)
 
@@ -33,7 +38,14 @@ export function MediaSurface({
   return (
     <>
       {mode === "picture" && photoUrl && (
-        <img src={photoUrl} alt="" style={{ position: "absolute", inset: 0, width:"100%", height:"100%", objectFit:"cover" }} />
+        <>
+          {/* shown the moment the picture changes; the real image fades in over it */}
+          <div className="picture-placeholder"
+            style={{ backgroundColor: dominantColor ?? "#000", backgroundImage: placeholder ? `url(${placeholder})` : undefined }} />
+          <img key={photoUrl} src={photoUrl} alt="" onLoad={() => setLoadedUrl(photoUrl)}
+            className={`picture-image${loadedUrl === photoUrl ? " loaded" : ""}`}
+            style={{ position: "absolute", inset: 0, width:"100%", height:"100%", objectFit:"cover" }} />
+        </>
       )}
       {mode === "picture" && pictureEmpty && (
         <div className="empty-picture-state">
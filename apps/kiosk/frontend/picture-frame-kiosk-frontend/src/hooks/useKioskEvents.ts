@@ -11,15 +11,21 @@ export function useKioskEvents({ apiBase = "", onMessage }: Opts) {
   onMessageRef.current = onMessage;
 
   const retryRef = useRef(0);
+  const lastEventIdRef = useRef<string | null>(null);
 
   useEffect(() => {
     let stopped = false;
     let es: EventSource | null = null;
 
     const connect = () => {
-      es = new EventSource(`${apiBase}/events`);
+      // A fresh EventSource does not send Last-Event-ID, so pass it along
+      // to have the backend replay what was missed while disconnected.
+      const lastEventId = lastEventIdRef.current;
+      const query = lastEventId ? `?last_event_id=${encodeURIComponent(lastEventId)}` : "";
+      es = new EventSource(`${apiBase}/events${query}`);
 
       es.onmessage = (e) => {
+        if (e.lastEventId) lastEventIdRef.current = e.lastEventId;
         try {
           const msg = JSON.parse(e.data) as PushMsg;
           onMessageRef.current(msg);
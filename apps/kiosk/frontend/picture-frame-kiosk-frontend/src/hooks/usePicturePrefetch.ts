@@ -0,0 +1,44 @@
+import { useCallback, useEffect, useRef } from "react";
+import type { UpcomingPicture } from "../types/push";
+
+// Start fetching this long before a picture is due, so download and decode
+// are done by the time the slideshow switches.
+const LEAD_MS = 15000;
+
+export function usePicturePrefetch() {
+  // Keeping the decoded <img> alive keeps its bitmap in the memory cache.
+  const preloadedRef = useRef(new Map<string, HTMLImageElement>());
+  const timersRef = useRef<number[]>([]);
+
+  const preload = useCallback((url: string) => {
+    if (preloadedRef.current.has(url)) return;
+    const img = new Image();
+    img.decoding = "async";
+    img.src = url;
+    preloadedRef.current.set(url, img);
+    img.decode().catch(() => {
+      // failed or superseded; the <img> in the frame will simply load it
+      preloadedRef.current.delete(url);
+    });
+  }, []);
+
+  const prefetch = useCallback((upcoming: UpcomingPicture[]) => {
+    timersRef.current.forEach((t) => window.clearTimeout(t));
+    timersRef.current = [];
+
+    const wanted = new Set(upcoming.map((p) => p.url));
+    for (const url of preloadedRef.current.keys()) {
+      if (!wanted.has(url)) preloadedRef.current.delete(url);
+    }
+
+    for (const picture of upcoming) {
+      const delay = picture.switch_at * 1000 - LEAD_MS - Date.now();
+      if (delay <= 0) preload(picture.url);
+      else timersRef.current.push(window.setTimeout(() => preload(picture.url), delay));
+    }
+  }, [preload]);
+
+  useEffect(() => () => timersRef.current.forEach((t) => window.clearTimeout(t)), []);
+
+  return prefetch;
+}
@@ -10,6 +10,13 @@ export type PictureSnapshot = {
   content_type: string | null;
   updated_at: number;
   url: string | null;
+  // as displayed, i.e. after EXIF rotation
+  width: number | null;
+  height: number | null;
+  orientation: number | null;
+  dominant_color: string | null;
+  // tiny data: URI shown blurred until the real image has loaded
+  placeholder: string | null;
 }
 
 export type PictureMsg = {
@@ -17,6 +24,23 @@ export type PictureMsg = {
   data: PictureSnapshot;
 }
 
+export type UpcomingPicture = {
+  picture_id: string;
+  url: string;
+  switch_at: number;
+}
+
+export type UpcomingSnapshot = {
+  current_picture_id: string | null;
+  interval_seconds: number;
+  upcoming: UpcomingPicture[];
+}
+
+export type PrefetchMsg = {
+  event: "prefetch";
+  data: UpcomingSnapshot;
+}
+
 export type CallState =
   | "idle"
   | "outgoing_ringing"
@@ -45,4 +69,9 @@ export type ReactionMsg = {
   data: { message: string };
 }
 
-export type PushMsg = VolumeMsg | PictureMsg | CallMsg | ReactionMsg
+export type ResyncMsg = {
+  event: "resync";
+  data: null;
+}
+
+export type PushMsg = VolumeMsg | PictureMsg | PrefetchMsg | CallMsg | ReactionMsg | ResyncMsg
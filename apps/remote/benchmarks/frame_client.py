@@ -0,0 +1,99 @@
+"""Compares a fresh httpx client per proxied call with the pooled per-frame client.
+
+A stand-in frame is served locally by uvicorn, and the remote's status()
+fan-out (four GETs in parallel) is timed both ways. Pass --frame-url to
+measure against a real frame instead; the Cloudflare Access headers are
+read from the same environment variables the remote uses.
+
+Run from apps/remote:
+
+    python benchmarks/frame_client.py [--rounds 200] [--frame-url https://.../api]
+"""
+
+from pathlib import Path
+import argparse
+import asyncio
+import socket
+import statistics
+import sys
+import threading
+import time
+
+from fastapi import FastAPI
+import httpx
+import uvicorn
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+STATUS_PATHS = ["/volume", "/volume", "/call/state", "/call/state"]
+
+frame = FastAPI()
+
+
+@frame.get("/api/volume")
+def volume():
+    return {"volume_percent": 40, "muted": False}
+
+
+@frame.get("/api/call/state")
+def call_state():
+    return {"state": "idle", "call": None}
+
+
+def serve_stand_in() -> str:
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(frame, log_level="warning"))
+    threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}/api"
+
+
+async def fresh_client_get(url: str, headers: dict[str, str]):
+    # What _frame_request used to do for every call.
+    async with httpx.AsyncClient(timeout=10) as client:
+        (await client.get(url, headers=headers)).raise_for_status()
+
+
+async def pooled_get(url: str, headers: dict[str, str]):
+    (await main._frame_client("adam").get(url, headers=headers)).raise_for_status()
+
+
+async def measure(get, base: str, headers: dict[str, str], rounds: int) -> list[float]:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await asyncio.gather(*(get(base + path, headers) for path in STATUS_PATHS))
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def percentile(timings: list[float], pct: int) -> float:
+    return statistics.quantiles(timings, n=100)[pct - 1]
+
+
+async def run(base: str, rounds: int):
+    headers = main.FRAME_HEADERS["adam"]
+    print(f"frame {base}, http2 {'on' if main.FRAME_HTTP2 else 'off'}, {rounds} status() fan-outs")
+    print(f"{'client':14} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, get in (("fresh per call", fresh_client_get), ("pooled", pooled_get)):
+        await measure(get, base, headers, 5)  # warm up
+        timings = await measure(get, base, headers, rounds)
+        print(f"{name:14} {percentile(timings, 50):8.2f} {percentile(timings, 95):8.2f}")
+    await main.close_frame_clients()
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--frame-url", help="a real frame API base instead of the local stand-in")
+    args = parser.parse_args()
+    asyncio.run(run(args.frame_url or serve_stand_in(), args.rounds))
+
+
+if __name__ == "__main__":
+    cli()
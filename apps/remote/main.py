@@ -1,15 +1,35 @@
+from collections import OrderedDict
+from dataclasses import dataclass
 import asyncio
+import gzip
+import json
+import logging
+import mimetypes
 import os
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional
+import re
+import time
+from typing import Any, AsyncIterator, Awaitable, BinaryIO, Callable, Dict, Literal, Optional
 import uuid
 
 import httpx
-from fastapi import FastAPI, File, HTTPException, Request, UploadFile
-from fastapi.responses import FileResponse, HTMLResponse, Response
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
+from starlette.datastructures import Headers
+from starlette.staticfiles import NotModifiedResponse
+
+try:
+    import brotli
+except ImportError:  # Optional; phones then get the gzip copies.
+    brotli = None
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # Optional: without it frame connections stay on HTTP/1.1.
+    h2 = None
 
 
 User = Literal["adam", "steve"]
@@ -41,6 +61,55 @@ FRAME_HEADERS: dict[User, Dict[str, str]] = {
     ),
 }
 
+# Each frame gets one long-lived client, so proxied calls reuse warm
+# keep-alive (and, through Cloudflare, HTTP/2) connections instead of paying
+# a TCP and TLS handshake every time.
+FRAME_HTTP2 = os.getenv("FRAME_HTTP2", "1") == "1" and h2 is not None
+FRAME_MAX_CONNECTIONS = int(os.getenv("FRAME_MAX_CONNECTIONS", "8"))
+FRAME_MAX_KEEPALIVE = int(os.getenv("FRAME_MAX_KEEPALIVE", "4"))
+FRAME_KEEPALIVE_EXPIRY = float(os.getenv("FRAME_KEEPALIVE_EXPIRY", "60"))
+FRAME_CONNECT_TIMEOUT = 5.0
+# How long a call may wait for a free connection before it gives up.
+FRAME_POOL_TIMEOUT = 5.0
+# Uploads are streamed to the frame as they arrive; these match the frame's
+# own limit, so oversized uploads are refused before anything is forwarded.
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(30 * 1024 * 1024)))
+UPLOAD_ENVELOPE_BYTES = 64 * 1024
+UPLOAD_TIMEOUT = 60.0
+# What a browser may send when fetching a picture, and what the frame answers
+# with so that the browser can cache and revalidate it; both pass through.
+FILE_REQUEST_HEADERS = ("if-none-match", "if-modified-since", "range", "if-range")
+FILE_RESPONSE_HEADERS = (
+    "content-type",
+    "content-length",
+    "content-encoding",
+    "content-range",
+    "accept-ranges",
+    "etag",
+    "last-modified",
+    "cache-control",
+    "vary",
+)
+
+# Identical polled reads of a frame share one upstream request while it is in
+# flight, and its result for this many seconds after. Any write proxied to
+# the same frame drops them at once. 0 keeps only the sharing.
+FRAME_READ_TTL = float(os.getenv("FRAME_READ_TTL", "2"))
+# Listing keys carry since= and the ETag, so they keep changing; this bounds
+# what a long-open remote may hold.
+FRAME_READ_CACHE_MAX = 256
+
+# Picture files never change under their picture_id, so the remote keeps
+# what it has fetched from the frames on local disk, least recently used
+# first out. 0 turns the cache off.
+PICTURE_CACHE_DIR = Path(os.getenv("PICTURE_CACHE_DIR", str(BASE_DIR / "cache")))
+PICTURE_CACHE_MAX_BYTES = int(os.getenv("PICTURE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+PICTURE_CACHE_KINDS = ("file", "thumb", "display")
+# Response headers kept with a cached picture and served with it.
+PICTURE_CACHE_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+
+log = logging.getLogger("remote")
+
 app = FastAPI(title="Remote Controller (UI + API)")
 
 
@@ -48,6 +117,14 @@ class SlideshowIn(BaseModel):
     interval_seconds: int = Field(ge=5, le=3600)
 
 
+class PictureMoveIn(BaseModel):
+    before_picture_id: Optional[str] = None
+
+
+class PicturePinIn(BaseModel):
+    pinned: bool
+
+
 def other(u: User) -> User:
     return "steve" if u == "adam" else "adam"
 
@@ -63,6 +140,43 @@ def _frame_url(u: User, path: str) -> str:
     return f"{FRAMES[u]}{suffix}"
 
 
+_frame_clients: dict[User, httpx.AsyncClient] = {}
+
+
+def _frame_client(u: User) -> httpx.AsyncClient:
+    client = _frame_clients.get(u)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            headers=FRAME_HEADERS[u],
+            http2=FRAME_HTTP2,
+            limits=httpx.Limits(
+                max_connections=FRAME_MAX_CONNECTIONS,
+                max_keepalive_connections=FRAME_MAX_KEEPALIVE,
+                keepalive_expiry=FRAME_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(10, connect=FRAME_CONNECT_TIMEOUT, pool=FRAME_POOL_TIMEOUT),
+        )
+        _frame_clients[u] = client
+    return client
+
+
+@app.on_event("startup")
+async def open_frame_clients():
+    for u in FRAMES:
+        _frame_client(u)
+
+
+@app.on_event("shutdown")
+async def close_frame_clients():
+    clients = list(_frame_clients.values())
+    _frame_clients.clear()
+    await asyncio.gather(*(client.aclose() for client in clients))
+
+
+def _frame_timeout(read: float) -> httpx.Timeout:
+    return httpx.Timeout(read, connect=FRAME_CONNECT_TIMEOUT, pool=FRAME_POOL_TIMEOUT)
+
+
 async def _frame_request(
     u: User,
     method: str,
@@ -70,17 +184,36 @@ async def _frame_request(
     *,
     json_body: Any = None,
     files: Any = None,
+    content: Any = None,
+    params: Any = None,
+    headers: Dict[str, str] | None = None,
     timeout: float = 10,
 ) -> httpx.Response:
     url = _frame_url(u, path)
-    headers = FRAME_HEADERS[u]
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            return await client.request(method, url, headers=headers, json=json_body, files=files)
+        return await _frame_client(u).request(
+            method,
+            url,
+            headers=headers,
+            json=json_body,
+            files=files,
+            content=content,
+            params=params,
+            timeout=_frame_timeout(timeout),
+        )
     except httpx.RequestError as e:
         raise HTTPException(502, f"Frame {u} {method} {path} failed: {str(e)}")
 
 
+def _frame_passthrough(response: httpx.Response) -> Response:
+    """The frame's answer as is, error statuses included."""
+    return Response(
+        content=response.content,
+        status_code=response.status_code,
+        media_type=response.headers.get("content-type"),
+    )
+
+
 def _raise_frame_error(u: User, method: str, path: str, response: httpx.Response):
     if response.is_success:
         return
@@ -95,41 +228,504 @@ def _json_from_frame(u: User, method: str, path: str, response: httpx.Response)
     return {"ok": True, "raw": response.text}
 
 
-async def frame_get(u: User, path: str) -> Any:
-    response = await _frame_request(u, "GET", path, timeout=5)
-    return _json_from_frame(u, "GET", path, response)
+_frame_reads: dict[tuple[Any, ...], "asyncio.Task[Any]"] = {}
+_frame_read_cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+# Bumped by every write to the frame; reads that overlap a write are not kept.
+_frame_generation: dict[User, int] = {"adam": 0, "steve": 0}
+_frame_read_stats = {"upstream": 0, "coalesced": 0, "cached": 0}
+
+
+def _cache_frame_read(key: tuple[Any, ...], value: Any):
+    now = time.monotonic()
+    _frame_read_cache.pop(key, None)
+    # Every entry lives FRAME_READ_TTL, so insertion order is expiry order.
+    while _frame_read_cache:
+        oldest = next(iter(_frame_read_cache))
+        if _frame_read_cache[oldest][0] > now and len(_frame_read_cache) < FRAME_READ_CACHE_MAX:
+            break
+        del _frame_read_cache[oldest]
+    _frame_read_cache[key] = (now + FRAME_READ_TTL, value)
+
+
+async def _shared_frame_read(key: tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """fetch() once for every concurrent caller with the same key; key[0] is the frame."""
+    cached = _frame_read_cache.get(key)
+    if cached is not None:
+        if cached[0] > time.monotonic():
+            _frame_read_stats["cached"] += 1
+            return cached[1]
+        del _frame_read_cache[key]
+
+    task = _frame_reads.get(key)
+    if task is None:
+        _frame_read_stats["upstream"] += 1
+        generation = _frame_generation[key[0]]
+        task = asyncio.ensure_future(fetch())
+        _frame_reads[key] = task
+
+        def done(task: "asyncio.Task[Any]"):
+            if _frame_reads.get(key) is task:
+                del _frame_reads[key]
+            if task.cancelled() or task.exception() is not None:
+                return
+            if FRAME_READ_TTL > 0 and _frame_generation[key[0]] == generation:
+                _cache_frame_read(key, task.result())
+
+        task.add_done_callback(done)
+    else:
+        _frame_read_stats["coalesced"] += 1
+    # Shielded so that one caller going away does not cancel the others.
+    return await asyncio.shield(task)
+
+
+def _frame_changed(u: User):
+    _frame_generation[u] += 1
+    for key in [key for key in _frame_reads if key[0] == u]:
+        del _frame_reads[key]
+    for key in [key for key in _frame_read_cache if key[0] == u]:
+        del _frame_read_cache[key]
+
+
+async def frame_get(u: User, path: str, *, fresh: bool = False) -> Any:
+    """GETs JSON from the frame; `fresh` skips sharing, for call orchestration."""
+
+    async def fetch() -> Any:
+        response = await _frame_request(u, "GET", path, timeout=5)
+        return _json_from_frame(u, "GET", path, response)
+
+    if fresh:
+        return await fetch()
+    return await _shared_frame_read((u, "GET", path), fetch)
 
 
 async def frame_post(u: User, path: str, *, json: Any = None, files: Any = None) -> Any:
-    response = await _frame_request(u, "POST", path, json_body=json, files=files)
+    try:
+        response = await _frame_request(u, "POST", path, json_body=json, files=files)
+    finally:
+        _frame_changed(u)
     return _json_from_frame(u, "POST", path, response)
 
 
 async def frame_put(u: User, path: str, *, json: Any = None) -> Any:
-    response = await _frame_request(u, "PUT", path, json_body=json)
+    try:
+        response = await _frame_request(u, "PUT", path, json_body=json)
+    finally:
+        _frame_changed(u)
     return _json_from_frame(u, "PUT", path, response)
 
 
 async def frame_delete(u: User, path: str) -> Any:
-    response = await _frame_request(u, "DELETE", path)
+    try:
+        response = await _frame_request(u, "DELETE", path)
+    finally:
+        _frame_changed(u)
     return _json_from_frame(u, "DELETE", path, response)
 
 
-async def frame_file_proxy(u: User, path: str) -> Response:
-    response = await _frame_request(u, "GET", path, timeout=15)
-    if response.status_code == 404:
-        raise HTTPException(404, f"Frame {u} GET {path} failed: 404")
-    _raise_frame_error(u, "GET", path, response)
-    media_type = response.headers.get("content-type", "application/octet-stream")
-    return Response(content=response.content, media_type=media_type)
+async def frame_file_proxy(u: User, path: str, request: Request) -> Response:
+    """Relays a picture from the frame as it arrives, keeping its cache headers."""
+    client = _frame_client(u)
+    upstream = client.build_request(
+        "GET",
+        _frame_url(u, path),
+        headers={name: request.headers[name] for name in FILE_REQUEST_HEADERS if name in request.headers},
+        timeout=_frame_timeout(15),
+    )
+    try:
+        response = await client.send(upstream, stream=True)
+    except httpx.RequestError as e:
+        raise HTTPException(502, f"Frame {u} GET {path} failed: {str(e)}")
+
+    relay = {name: response.headers[name] for name in FILE_RESPONSE_HEADERS if name in response.headers}
+    if response.status_code == 304:
+        await response.aclose()
+        return Response(status_code=304, headers=relay)
+    if response.status_code not in (200, 206):
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        if response.status_code == 404:
+            raise HTTPException(404, f"Frame {u} GET {path} failed: 404")
+        _raise_frame_error(u, "GET", path, response)
+    # Raw bytes, so Content-Length and Content-Encoding still describe them.
+    return StreamingResponse(_relay_body(response), status_code=response.status_code, headers=relay)
+
+
+async def _relay_body(response: httpx.Response) -> AsyncIterator[bytes]:
+    """The raw upstream body; its connection goes back to the pool however the relay ends."""
+    try:
+        async for chunk in response.aiter_raw():
+            yield chunk
+    finally:
+        # Shielded: after a disconnect the cancellation would cut the close short.
+        await asyncio.shield(response.aclose())
+
+
+# -------------------------
+# Picture cache
+# -------------------------
+
+_PICTURE_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+@dataclass
+class CachedPicture:
+    path: Path
+    size: int
+    headers: dict[str, str]
+    # Responses that have yet to send the file; a dropped entry's file is
+    # removed once the last of them is done.
+    readers: int = 0
+    dropped: bool = False
+
+
+# (frame, picture_id, kind) -> cached file, least recently used first.
+_picture_cache: "OrderedDict[tuple[User, str, str], CachedPicture]" = OrderedDict()
+_picture_cache_bytes = 0
+_picture_cache_stats = {"hits": 0, "misses": 0, "bytes_saved": 0, "evictions": 0}
+# Bumped whenever pictures are forgotten; a download that overlapped it is not kept.
+_picture_cache_forgets = 0
+
+
+def _picture_cache_path(key: tuple[User, str, str]) -> Path:
+    """A fresh file name for the key, so a replaced copy never shares a path with the new one."""
+    u, picture_id, kind = key
+    return PICTURE_CACHE_DIR / u / f"{picture_id}.{kind}.{uuid.uuid4().hex[:8]}"
+
+
+def _picture_cache_key(u: User, picture_id: str, kind: str) -> tuple[User, str, str] | None:
+    if PICTURE_CACHE_MAX_BYTES <= 0 or not _PICTURE_ID.fullmatch(picture_id):
+        return None
+    return (u, picture_id, kind)
+
+
+def _cacheable(headers: Any) -> bool:
+    """Whether the frame marked the response as safe to keep, e.g. not a fallback for a rendition."""
+    directives = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        directives[name.lower()] = value
+    if directives.keys() & {"no-cache", "no-store", "private"}:
+        return False
+    if "immutable" in directives:
+        return True
+    try:
+        return int(directives.get("max-age", "0")) > 0
+    except ValueError:
+        return False
+
+
+def _unlink_cache_files(path: Path):
+    for name in (path.name, path.name + ".json"):
+        try:
+            path.with_name(name).unlink(missing_ok=True)
+        except OSError as e:
+            log.warning("Cannot remove %s from the picture cache: %s", name, e)
+
+
+def _discard_cache_files(path: Path):
+    """Removes a cached file and its sidecar in a worker thread, without waiting for it."""
+    asyncio.get_running_loop().run_in_executor(None, _unlink_cache_files, path)
+
+
+def _picture_cache_drop(key: tuple[User, str, str]):
+    global _picture_cache_bytes
+    entry = _picture_cache.pop(key, None)
+    if entry is None:
+        return
+    _picture_cache_bytes -= entry.size
+    entry.dropped = True
+    if not entry.readers:
+        _discard_cache_files(entry.path)
+
+
+def _commit_cache_file(out: BinaryIO, tmp: Path, path: Path, headers: dict[str, str]) -> int | None:
+    """Renames a received picture into place next to its sidecar; runs in a worker thread."""
+    out.close()
+    size = tmp.stat().st_size
+    if size > PICTURE_CACHE_MAX_BYTES:
+        tmp.unlink(missing_ok=True)
+        return None
+    path.with_name(path.name + ".json").write_text(json.dumps(headers))
+    tmp.replace(path)
+    return size
+
+
+def _discard_cache_tmp(out: BinaryIO, tmp: Path):
+    out.close()
+    tmp.unlink(missing_ok=True)
+
+
+async def _picture_cache_store(
+    key: tuple[User, str, str], out: BinaryIO, tmp: Path, headers: dict[str, str], forgets: int
+):
+    """Moves a fully received picture into the cache and evicts down to the budget."""
+    global _picture_cache_bytes
+    path = _picture_cache_path(key)
+    try:
+        size = await asyncio.to_thread(_commit_cache_file, out, tmp, path, headers)
+    except OSError as e:
+        log.warning("Cannot keep %s in the picture cache: %s", path.name, e)
+        await asyncio.to_thread(_discard_cache_tmp, out, tmp)
+        _discard_cache_files(path)
+        return
+    if size is None:
+        return
+    if forgets != _picture_cache_forgets:
+        # The picture may have been deleted while it was downloading.
+        _discard_cache_files(path)
+        return
+    _picture_cache_drop(key)
+    _picture_cache[key] = CachedPicture(path, size, headers)
+    _picture_cache_bytes += size
+    while _picture_cache_bytes > PICTURE_CACHE_MAX_BYTES:
+        _picture_cache_drop(next(iter(_picture_cache)))
+        _picture_cache_stats["evictions"] += 1
+
+
+def picture_cache_forget(u: User, picture_ids: Any):
+    global _picture_cache_forgets
+    keys = [(u, picture_id, kind) for picture_id in picture_ids for kind in PICTURE_CACHE_KINDS]
+    if not keys:
+        return
+    _picture_cache_forgets += 1
+    for key in keys:
+        _picture_cache_drop(key)
+
+
+def picture_cache_retain(u: User, picture_ids: set[str]):
+    """Forgets the frame's cached pictures that are no longer in its playlist."""
+    stale = {key[1] for key in _picture_cache if key[0] == u and key[1] not in picture_ids}
+    picture_cache_forget(u, stale)
+
+
+def _load_picture_cache():
+    """Rebuilds the index from disk, oldest first; runs in a worker thread."""
+    global _picture_cache_bytes
+    found = []
+    for u in FRAMES:
+        directory = PICTURE_CACHE_DIR / u
+        directory.mkdir(parents=True, exist_ok=True)
+        for path in directory.iterdir():
+            if path.name.endswith(".json"):
+                # Read with its picture; left behind if the picture is gone.
+                if not path.with_name(path.name[: -len(".json")]).exists():
+                    path.unlink(missing_ok=True)
+                continue
+            picture_id, _, kind = path.name.partition(".")
+            kind = kind.partition(".")[0]
+            try:
+                if kind not in PICTURE_CACHE_KINDS:
+                    # A download that never finished.
+                    raise ValueError(path.name)
+                headers = json.loads(path.with_name(path.name + ".json").read_text())
+                stat = path.stat()
+            except (OSError, ValueError):
+                _unlink_cache_files(path)
+                continue
+            found.append((stat.st_mtime, (u, picture_id, kind), CachedPicture(path, stat.st_size, headers)))
+    found.sort(key=lambda item: item[0])
+    _picture_cache.clear()
+    for _, key, entry in found:
+        older = _picture_cache.pop(key, None)
+        if older is not None:
+            _unlink_cache_files(older.path)
+        _picture_cache[key] = entry
+    _picture_cache_bytes = sum(entry.size for entry in _picture_cache.values())
+
+
+@app.on_event("startup")
+async def open_picture_cache():
+    if PICTURE_CACHE_MAX_BYTES > 0:
+        await asyncio.to_thread(_load_picture_cache)
+
+
+class CachedPictureResponse(FileResponse):
+    """Sends a cached picture, keeping its file on disk until it has been sent."""
+
+    def __init__(self, entry: CachedPicture):
+        # FileResponse reads from the page cache in chunks and handles Range.
+        super().__init__(entry.path, headers=entry.headers, media_type=entry.headers.get("content-type"))
+        self.entry = entry
+        entry.readers += 1
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.entry.readers -= 1
+            if self.entry.dropped and not self.entry.readers:
+                _discard_cache_files(self.entry.path)
+
+
+async def cached_picture_proxy(u: User, picture_id: str, kind: str, request: Request) -> Response:
+    """Serves a picture from the local cache, fetching and keeping it on a miss."""
+    path = f"/pictures/{picture_id}/{kind}"
+    key = _picture_cache_key(u, picture_id, kind)
+    if key is None:
+        return await frame_file_proxy(u, path, request)
+
+    entry = _picture_cache.get(key)
+    if entry is not None:
+        _picture_cache.move_to_end(key)
+        _picture_cache_stats["hits"] += 1
+        etag = entry.headers.get("etag")
+        if etag and request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=entry.headers)
+        _picture_cache_stats["bytes_saved"] += entry.size
+        return CachedPictureResponse(entry)
+
+    _picture_cache_stats["misses"] += 1
+    response = await frame_file_proxy(u, path, request)
+    cacheable = (
+        isinstance(response, StreamingResponse)
+        and response.status_code == 200
+        and "content-encoding" not in response.headers
+        and _cacheable(response.headers)
+    )
+    if cacheable:
+        response.body_iterator = _tee_into_cache(key, response.body_iterator, response.headers)
+    return response
+
+
+def _open_cache_tmp(tmp: Path) -> BinaryIO:
+    tmp.parent.mkdir(parents=True, exist_ok=True)
+    return tmp.open("wb")
+
+
+async def _tee_into_cache(key: tuple[User, str, str], body: Any, response_headers: Any):
+    """Passes the body through while writing it to a temp file next to its cache slot.
+
+    Failing to write only means the picture is not kept; the browser still
+    gets all of it.
+    """
+    headers = {name: response_headers[name] for name in PICTURE_CACHE_HEADERS if name in response_headers}
+    forgets = _picture_cache_forgets
+    tmp = PICTURE_CACHE_DIR / key[0] / f".{uuid.uuid4().hex}.part"
+    loop = asyncio.get_running_loop()
+    out: BinaryIO | None = None
+    received = 0
+    try:
+        out = await asyncio.to_thread(_open_cache_tmp, tmp)
+    except OSError as e:
+        log.warning("Not keeping %s in the picture cache: %s", key, e)
+    try:
+        async for chunk in body:
+            if out is not None:
+                try:
+                    await asyncio.to_thread(out.write, chunk)
+                except OSError as e:
+                    log.warning("Not keeping %s in the picture cache: %s", key, e)
+                    loop.run_in_executor(None, _discard_cache_tmp, out, tmp)
+                    out = None
+            received += len(chunk)
+            yield chunk
+    except BaseException:
+        if out is not None:
+            loop.run_in_executor(None, _discard_cache_tmp, out, tmp)
+        raise
+    if out is None:
+        return
+    expected = response_headers.get("content-length")
+    if expected is not None and int(expected) != received:
+        loop.run_in_executor(None, _discard_cache_tmp, out, tmp)
+        return
+    # The browser may hang up as soon as it has the last byte, which cancels
+    # this generator; that must not cut keeping the copy short.
+    await asyncio.shield(_picture_cache_store(key, out, tmp, headers, forgets))
 
 
 # -------------------------
 # UI
 # -------------------------
 
+STATIC_DIR = BASE_DIR / "static"
+# remote.js, remote.css and the favicon are sent encoded to phones that accept
+# it, from .br/.gz copies written next to them at startup.
+STATIC_COMPRESSED_SUFFIXES = {".js", ".css", ".ico"}
+STATIC_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepted_encodings(header: str | None) -> set[str]:
+    accepted = set()
+    for part in (header or "").replace(" ", "").lower().split(","):
+        coding, _, q = part.partition(";q=")
+        try:
+            if float(q or 1) > 0:
+                accepted.add(coding)
+        except ValueError:
+            pass
+    return accepted
+
+
+def _precompress_static_assets() -> None:
+    """Refreshes the encoded copies that are older than their asset; runs in a worker thread."""
+    for path in STATIC_DIR.iterdir():
+        if path.suffix not in STATIC_COMPRESSED_SUFFIXES:
+            continue
+        mtime = path.stat().st_mtime_ns
+        for encoding, suffix in STATIC_ENCODINGS:
+            sibling = path.with_name(path.name + suffix)
+            if (encoding == "br" and brotli is None) or (
+                sibling.exists() and sibling.stat().st_mtime_ns >= mtime
+            ):
+                continue
+            data = path.read_bytes()
+            if encoding == "br":
+                compressed = brotli.compress(data, quality=11)
+            else:
+                compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            # Written aside first so that a request never sees a half-written copy.
+            tmp = sibling.with_name(sibling.name + ".tmp")
+            try:
+                tmp.write_bytes(compressed)
+                os.replace(tmp, sibling)
+            except OSError as e:
+                # e.g. a read-only image; the assets then go out as they are.
+                log.warning("Cannot write %s: %s", sibling, e)
+                return
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """/static, answered from the .br or .gz copy when the phone accepts one."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        path = Path(full_path)
+        if path.suffix not in STATIC_COMPRESSED_SUFFIXES:
+            return super().file_response(full_path, stat_result, scope, status_code)
+        request_headers = Headers(scope=scope)
+        accepted = _accepted_encodings(request_headers.get("accept-encoding"))
+        headers = {"Vary": "Accept-Encoding"}
+        for encoding, suffix in STATIC_ENCODINGS:
+            sibling = path.with_name(path.name + suffix)
+            if encoding not in accepted or not sibling.is_file():
+                continue
+            sibling_stat = sibling.stat()
+            if sibling_stat.st_mtime_ns < stat_result.st_mtime_ns:
+                continue
+            path, stat_result = sibling, sibling_stat
+            headers["Content-Encoding"] = encoding
+            break
+        response = FileResponse(
+            path,
+            status_code=status_code,
+            stat_result=stat_result,
+            media_type=mimetypes.guess_type(full_path)[0],
+            headers=headers,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+@app.on_event("startup")
+async def precompress_static():
+    await asyncio.to_thread(_precompress_static_assets)
+
+
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
+app.mount("/static", PrecompressedStaticFiles(directory=str(STATIC_DIR)), name="static")
 
 
 @app.get("/favicon.ico", include_in_schema=False)
@@ -181,6 +777,19 @@ def health():
             "adam": bool(FRAME_HEADERS["adam"]),
             "steve": bool(FRAME_HEADERS["steve"]),
         },
+        "frame_reads": {"ttl_seconds": FRAME_READ_TTL, **_frame_read_stats},
+    }
+
+
+@app.get("/api/picture-cache")
+def picture_cache_stats():
+    lookups = _picture_cache_stats["hits"] + _picture_cache_stats["misses"]
+    return {
+        "entries": len(_picture_cache),
+        "bytes": _picture_cache_bytes,
+        "max_bytes": PICTURE_CACHE_MAX_BYTES,
+        "hit_rate": _picture_cache_stats["hits"] / lookups if lookups else None,
+        **_picture_cache_stats,
     }
 
 
@@ -239,41 +848,128 @@ async def reaction(self_user: str, body: Dict[str, Any]):
     return await frame_post(them, "/reaction", json={"message": msg.strip()})
 
 
+class _UploadTooLarge(Exception):
+    pass
+
+
 @app.post("/api/{self_user}/picture", status_code=201)
-async def picture(self_user: str, file: UploadFile = File(...)):
+async def picture(self_user: str, request: Request):
     me = _ensure_user(self_user)
     them = other(me)
 
-    data = await file.read()
-    files = {
-        "file": (
-            file.filename or "upload",
-            data,
-            file.content_type or "application/octet-stream",
+    # The multipart body is relayed unparsed, one chunk at a time; the frame
+    # reads the next chunk only once it has taken the previous one.
+    content_type = request.headers.get("content-type", "")
+    if not content_type.startswith("multipart/form-data"):
+        raise HTTPException(415, "Expected a multipart/form-data upload")
+    limit = MAX_UPLOAD_BYTES + UPLOAD_ENVELOPE_BYTES
+    headers = {"Content-Type": content_type}
+    declared = request.headers.get("content-length")
+    if declared is not None:
+        if not declared.isdigit():
+            raise HTTPException(400, "Invalid Content-Length")
+        if int(declared) > limit:
+            raise HTTPException(413, "Upload too large")
+        headers["Content-Length"] = declared
+
+    async def body():
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > limit:
+                raise _UploadTooLarge()
+            yield chunk
+
+    try:
+        response = await _frame_request(
+            them, "POST", "/picture", content=body(), headers=headers, timeout=UPLOAD_TIMEOUT
         )
-    }
-    return await frame_post(them, "/picture", files=files)
+    except _UploadTooLarge:
+        raise HTTPException(413, "Upload too large")
+    finally:
+        _frame_changed(them)
+    # 413, 415, 507 and friends from the frame reach the browser unchanged.
+    return _frame_passthrough(response)
 
 
 @app.get("/api/{self_user}/pictures")
-async def pictures(self_user: str):
+async def pictures(self_user: str, request: Request):
     me = _ensure_user(self_user)
     them = other(me)
-    return await frame_get(them, "/pictures")
+    # since/cursor/limit and If-None-Match pass straight through, so an
+    # unchanged playlist costs the frame one comparison and a 304.
+    headers = {}
+    if request.headers.get("if-none-match"):
+        headers["If-None-Match"] = request.headers["if-none-match"]
+    params = str(request.query_params)
+
+    async def fetch() -> httpx.Response:
+        response = await _frame_request(them, "GET", "/pictures", params=params, headers=headers, timeout=5)
+        # Raised here so that a failed read is shared but never kept.
+        if response.status_code != 304:
+            _raise_frame_error(them, "GET", "/pictures", response)
+        return response
+
+    # Tabs polling with the same query and ETag share one upstream request.
+    response = await _shared_frame_read(
+        (them, "GET", "/pictures", params, headers.get("If-None-Match")), fetch
+    )
+    relay = {name: response.headers[name] for name in ("etag", "cache-control") if name in response.headers}
+    if response.status_code == 304:
+        return Response(status_code=304, headers=relay)
+    listing = _json_from_frame(them, "GET", "/pictures", response)
+    if isinstance(listing, dict):
+        if listing.get("delta"):
+            picture_cache_forget(them, listing.get("removed") or [])
+        elif "cursor" not in request.query_params and "limit" not in request.query_params:
+            picture_cache_retain(them, {image.get("picture_id") for image in listing.get("images") or []})
+    return JSONResponse(listing, headers=relay)
 
 
 @app.delete("/api/{self_user}/pictures/{picture_id}")
 async def delete_picture(self_user: str, picture_id: str):
     me = _ensure_user(self_user)
     them = other(me)
-    return await frame_delete(them, f"/pictures/{picture_id}")
+    try:
+        return await frame_delete(them, f"/pictures/{picture_id}")
+    finally:
+        # Even when the frame answered with an error, it may have deleted it.
+        picture_cache_forget(them, [picture_id])
+
+
+@app.put("/api/{self_user}/pictures/{picture_id}/position")
+async def move_picture(self_user: str, picture_id: str, body: PictureMoveIn):
+    me = _ensure_user(self_user)
+    them = other(me)
+    return await frame_put(them, f"/pictures/{picture_id}/position", json=body.model_dump())
+
+
+@app.put("/api/{self_user}/pictures/{picture_id}/pinned")
+async def pin_picture(self_user: str, picture_id: str, body: PicturePinIn):
+    me = _ensure_user(self_user)
+    them = other(me)
+    return await frame_put(them, f"/pictures/{picture_id}/pinned", json=body.model_dump())
 
 
 @app.get("/api/{self_user}/pictures/{picture_id}/file")
-async def picture_file(self_user: str, picture_id: str):
+async def picture_file(self_user: str, picture_id: str, request: Request):
+    me = _ensure_user(self_user)
+    them = other(me)
+    return await cached_picture_proxy(them, picture_id, "file", request)
+
+
+@app.get("/api/{self_user}/pictures/{picture_id}/thumb")
+async def picture_thumb(self_user: str, picture_id: str, request: Request):
+    me = _ensure_user(self_user)
+    them = other(me)
+    return await cached_picture_proxy(them, picture_id, "thumb", request)
+
+
+@app.get("/api/{self_user}/pictures/{picture_id}/display")
+async def picture_display(self_user: str, picture_id: str, request: Request):
     me = _ensure_user(self_user)
     them = other(me)
-    return await frame_file_proxy(them, f"/pictures/{picture_id}/file")
+    return await cached_picture_proxy(them, picture_id, "display", request)
 
 
 @app.get("/api/{self_user}/picture/meta")
@@ -284,10 +980,10 @@ async def picture_meta(self_user: str):
 
 
 @app.get("/api/{self_user}/picture")
-async def picture_current_file(self_user: str):
+async def picture_current_file(self_user: str, request: Request):
     me = _ensure_user(self_user)
     them = other(me)
-    return await frame_file_proxy(them, "/picture")
+    return await frame_file_proxy(them, "/picture", request)
 
 
 @app.get("/api/{self_user}/slideshow")
@@ -318,7 +1014,7 @@ def _extract_call_id(resp: Any) -> Optional[str]:
 
 
 async def _get_frame_call_id(u: User) -> Optional[str]:
-    st = await frame_get(u, "/call/state")
+    st = await frame_get(u, "/call/state", fresh=True)
     if isinstance(st, dict):
         call = st.get("call")
         if isinstance(call, dict) and isinstance(call.get("call_id"), str):
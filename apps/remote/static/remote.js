@@ -88,6 +88,9 @@
 
   let previewUrl = null;
   let playlistRefreshToken = 0;
+  // Last playlist seen from the partner frame; polls only ask for what changed since.
+  let playlistCache = null;
+  let playlistEtag = null;
   let playlistPollHandle = null;
 
   function showSelectionPreview(file) {
@@ -203,10 +206,15 @@
     playlistEl.innerHTML = playlist.images
       .map((image) => {
         const isCurrent = image.picture_id === playlist.current_picture_id;
-        const url = `${API}/pictures/${encodeURIComponent(image.picture_id)}/file?t=${image.uploaded_at || Date.now()}`;
+        const url = `${API}/pictures/${encodeURIComponent(image.picture_id)}/thumb?t=${image.uploaded_at || Date.now()}`;
+        // Colour and blurred preview fill the slot until the thumbnail arrives.
+        const preview = [
+          image.dominant_color ? `background-color:${escapeHtml(image.dominant_color)}` : "",
+          image.placeholder ? `background-image:url('${escapeHtml(image.placeholder)}');background-size:cover` : "",
+        ].filter(Boolean).join(";");
         return `
           <div class="playlist-item">
-            <img class="playlist-thumb" src="${url}" alt="${escapeHtml(image.filename)}">
+            <img class="playlist-thumb" src="${url}" alt="${escapeHtml(image.filename)}" style="${preview}">
             <div class="playlist-meta">
               <div class="playlist-name">${escapeHtml(image.filename)}</div>
               <div class="playlist-actions">
@@ -221,14 +229,47 @@
     bindPlaylistActions();
   }
 
+  function applyPlaylistResponse(data) {
+    if (playlistCache && data.version != null && data.version < playlistCache.version) return;
+    if (!data.delta || !playlistCache) {
+      playlistCache = data;
+      return;
+    }
+    const byId = new Map(playlistCache.images.map((image) => [image.picture_id, image]));
+    for (const pictureId of data.removed) byId.delete(pictureId);
+    for (const image of [...data.added, ...data.changed]) byId.set(image.picture_id, image);
+    playlistCache = {
+      ...data,
+      images: [...byId.values()].sort((a, b) => a.sort_key - b.sort_key),
+    };
+  }
+
+  // Resolves to false when the frame answered 304, i.e. nothing changed.
+  async function fetchPartnerPlaylist() {
+    const since = playlistCache?.version != null ? `?since=${playlistCache.version}` : "";
+    const response = await fetch(`${API}/pictures${since}`, {
+      cache: "no-store",
+      headers: playlistEtag ? { "If-None-Match": playlistEtag } : {},
+    });
+    if (response.status === 304) return false;
+    const text = await response.text();
+    if (!response.ok) throw new Error(`${response.status} ${text}`);
+    applyPlaylistResponse(JSON.parse(text));
+    playlistEtag = response.headers.get("ETag");
+    return true;
+  }
+
   async function refreshPartnerPictures() {
     const refreshToken = ++playlistRefreshToken;
     try {
-      const playlist = await reqJson("GET", "pictures");
-      if (refreshToken !== playlistRefreshToken) return;
-      renderPlaylist(playlist);
+      const changed = await fetchPartnerPlaylist();
+      if (refreshToken !== playlistRefreshToken || !changed) return;
+      renderPlaylist(playlistCache);
       await refreshCurrentPicture();
     } catch (err) {
+      // Start over with a full listing so the error view gets replaced.
+      playlistCache = null;
+      playlistEtag = null;
       log(`ERR GET pictures -> ${err}`);
       const hasCurrentPicture = await refreshCurrentPicture();
       const playlistUnsupported = String(err).includes("404");